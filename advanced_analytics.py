@@ -30,7 +30,7 @@ import time
 from datetime import datetime
 from collections import defaultdict, Counter
 import numpy as np
-from logger import game_logger
+from logger import game_logger, read_session_journal
 
 class TemporalPatternAnalyzer:
     """Analyzes temporal patterns across game snapshots."""
@@ -57,9 +57,11 @@ class TemporalPatternAnalyzer:
         if not self.session_id:
             sessions_dir = os.path.join(game_logger.log_directory, "sessions")
             if os.path.exists(sessions_dir):
-                sessions = sorted([s for s in os.listdir(sessions_dir) if os.path.isdir(os.path.join(sessions_dir, s))])
-                if sessions:
-                    self.session_id = sessions[-1]  # Use most recent
+                # One pass over the directory; DirEntry knows its type without a stat
+                with os.scandir(sessions_dir) as it:
+                    latest = max((entry.name for entry in it if entry.is_dir()), default=None)
+                if latest:
+                    self.session_id = latest  # Use most recent
         
         if not self.session_id:
             print("No game sessions found.")
@@ -88,6 +90,11 @@ class TemporalPatternAnalyzer:
                 except Exception as e:
                     print(f"Error loading snapshot {snapshot_file}: {e}")
         
+        # Newer sessions append their snapshots to the session journal instead
+        for snapshot in read_session_journal(session_dir, "snapshot"):
+            snapshot['_timestamp'] = snapshot.get('snapshot_time')
+            self.snapshots.append(snapshot)
+        
         # Load events
         events_dir = os.path.join(session_dir, "events")
         if os.path.exists(events_dir):
@@ -40,7 +40,7 @@ import sys
 import argparse
 import json
 from datetime import datetime
-from logger import game_logger
+from logger import game_logger, read_session_journal
 from visualization import GameStateVisualizer
 import shutil
 from recursive_analyzer import RecursiveAnalyzer
@@ -255,6 +255,38 @@ def main():
         print(report)
         return
 
+def load_session_snapshots(session_dir):
+    """Load a session's snapshots, oldest first.
+    
+    Older sessions keep each snapshot in its own file under snapshots/, while newer
+    ones append them to the session journal; both are read here.
+    
+    Args:
+        session_dir (str): The session's directory
+        
+    Returns:
+        list: (snapshot_time, snapshot) pairs
+    """
+    snapshots = []
+    snapshots_dir = os.path.join(session_dir, "snapshots")
+    if os.path.exists(snapshots_dir):
+        with os.scandir(snapshots_dir) as it:
+            snapshot_files = sorted(entry.name for entry in it if entry.name.endswith('.json'))
+        for snapshot_file in snapshot_files:
+            try:
+                with open(os.path.join(snapshots_dir, snapshot_file), 'r') as f:
+                    snapshot = json.load(f)
+            except Exception as e:
+                print(f"Error loading snapshot {snapshot_file}: {e}")
+                continue
+            # Extract timestamp from filename (snapshot_TIMESTAMP.json)
+            timestamp = snapshot_file.replace('snapshot_', '').replace('.json', '')
+            snapshots.append((timestamp, snapshot))
+    
+    for snapshot in read_session_journal(session_dir, "snapshot"):
+        snapshots.append((snapshot.get('snapshot_time'), snapshot))
+    return snapshots
+
 def list_all_sessions():
     """List all available game sessions with metadata.
     
@@ -274,10 +306,11 @@ def list_all_sessions():
         
     # List all session directories
     sessions = []
-    for dirname in os.listdir(sessions_dir):
-        session_dir = os.path.join(sessions_dir, dirname)
-        if os.path.isdir(session_dir):
-            sessions.append(dirname)
+    with os.scandir(sessions_dir) as it:
+        for entry in it:
+            # DirEntry knows its type from the directory listing, without a stat
+            if entry.is_dir():
+                sessions.append(entry.name)
             
     if not sessions:
         print("No game sessions found.")
@@ -338,47 +371,35 @@ def list_session_snapshots(session_id):
         
     timestamp_prefix = "_".join(timestamp_part)
     
-    # First check session-specific snapshots directory
+    # First check the session's own snapshots
     sessions_dir = os.path.join(game_logger.log_directory, "sessions")
     session_dir = os.path.join(sessions_dir, session_id)
-    snapshots_dir = os.path.join(session_dir, "snapshots")
+    snapshots = [snapshot for _, snapshot in load_session_snapshots(session_dir)]
     
-    snapshot_files = []
-    
-    # Check session-specific directory first
-    if os.path.exists(snapshots_dir):
-        for filename in os.listdir(snapshots_dir):
-            if filename.startswith("snapshot_") and filename.endswith(".json"):
-                snapshot_files.append(os.path.join(snapshots_dir, filename))
-    
-    # Then check legacy location (top-level logs directory)
-    legacy_snapshots = []
-    for filename in os.listdir(game_logger.log_directory):
-        # Match snapshots by timestamp prefix
-        if (filename.startswith(f"snapshot_{timestamp_prefix}") and 
-            filename.endswith(".json")):
-            legacy_snapshots.append(os.path.join(game_logger.log_directory, filename))
-    
-    # Add legacy snapshots if we don't have session-specific ones
-    if not snapshot_files and legacy_snapshots:
+    # Fall back to the legacy location (top-level logs directory) if there are none
+    if not snapshots:
+        legacy_snapshots = []
+        for filename in os.listdir(game_logger.log_directory):
+            # Match snapshots by timestamp prefix
+            if (filename.startswith(f"snapshot_{timestamp_prefix}") and 
+                filename.endswith(".json")):
+                legacy_snapshots.append(os.path.join(game_logger.log_directory, filename))
+        
+        if not legacy_snapshots:
+            print(f"No snapshots found for session {session_id}")
+            return
         print(f"Using legacy snapshots from main logs directory for session {session_id}")
-        snapshot_files = legacy_snapshots
-    
-    if not snapshot_files:
-        print(f"No snapshots found for session {session_id}")
-        return
-    
-    # Sort by timestamp
-    snapshot_files.sort()
-    
-    snapshots = []
-    for snapshot_file in snapshot_files:
-        try:
-            with open(snapshot_file, 'r') as f:
-                snapshot = json.load(f)
-                snapshots.append(snapshot)
-        except Exception as e:
-            print(f"Error loading snapshot {snapshot_file}: {str(e)}")
+        
+        # Sort by timestamp
+        legacy_snapshots.sort()
+        
+        for snapshot_file in legacy_snapshots:
+            try:
+                with open(snapshot_file, 'r') as f:
+                    snapshot = json.load(f)
+                    snapshots.append(snapshot)
+            except Exception as e:
+                print(f"Error loading snapshot {snapshot_file}: {str(e)}")
     
     if not snapshots:
         print(f"No valid snapshots found for session {session_id}")
@@ -438,52 +459,53 @@ def analyze_duplet(session_id, timestamp):
         
     print(f"Analyzing duplet from {timestamp}:")
     
-    # Load snapshot data
+    # Load snapshot data. A duplet shares its snapshot's snapshot_time, which also
+    # finds snapshots stored in the session journal rather than their own file.
     snapshot_file = target_duplet.get('snapshot_file')
-    if os.path.exists(snapshot_file):
-        with open(snapshot_file, 'r') as f:
-            snapshot_data = json.load(f)
-            print(f"Snapshot contains {len(snapshot_data.get('snapshot_data', {}))} categories")
-            
-            # Extract and display key metrics
-            categories = snapshot_data.get('snapshot_data', {})
-            if 'player' in categories and categories['player']:
-                player_data = categories['player'][0]['data']
-                print(f"\nPlayer State:")
-                print(f"  Health: {player_data.get('health', 'N/A')}/{player_data.get('max_health', 'N/A')}")
-                print(f"  Position: {player_data.get('position', {}).get('x', 'N/A')}, {player_data.get('position', {}).get('y', 'N/A')}")
-                print(f"  Wetness: {player_data.get('wetness', 'N/A')}")
-                print(f"  Fire Resistance: {player_data.get('fire_resistance', 'N/A')}")
-                print(f"  Obsidian Armor: {player_data.get('has_obsidian_armor', 'N/A')}")
-                print(f"  Current Area: {player_data.get('current_area', 'N/A')}")
-            
-            # Count enemies by type
-            if 'enemy_spawn' in categories:
-                enemy_types = {}
-                for entry in categories['enemy_spawn']:
-                    enemy_type = entry['data'].get('type', 'unknown')
-                    if enemy_type not in enemy_types:
-                        enemy_types[enemy_type] = 0
-                    enemy_types[enemy_type] += 1
-                    
-                print(f"\nEnemy Distribution:")
-                for enemy_type, count in enemy_types.items():
-                    print(f"  {enemy_type}: {count}")
-            
-            # Combat statistics
-            if 'combat' in categories:
-                combat_events = categories['combat']
-                damage_dealt = sum(event['data'].get('actual_damage', 0) for event in combat_events 
-                                  if event['data'].get('attacker') == 'player')
-                damage_taken = sum(event['data'].get('actual_damage', 0) for event in combat_events 
-                                  if event['data'].get('defender') == 'player')
-                                  
-                print(f"\nCombat Statistics:")
-                print(f"  Total combat events: {len(combat_events)}")
-                print(f"  Player damage dealt: {damage_dealt}")
-                print(f"  Player damage taken: {damage_taken}")
+    snapshot_data = next((snapshot for snapshot in game_logger.get_session_snapshots(session_id)
+                          if snapshot.get('snapshot_time') == timestamp), None)
+    if snapshot_data is not None:
+        print(f"Snapshot contains {len(snapshot_data.get('snapshot_data', {}))} categories")
+        
+        # Extract and display key metrics
+        categories = snapshot_data.get('snapshot_data', {})
+        if 'player' in categories and categories['player']:
+            player_data = categories['player'][0]['data']
+            print(f"\nPlayer State:")
+            print(f"  Health: {player_data.get('health', 'N/A')}/{player_data.get('max_health', 'N/A')}")
+            print(f"  Position: {player_data.get('position', {}).get('x', 'N/A')}, {player_data.get('position', {}).get('y', 'N/A')}")
+            print(f"  Wetness: {player_data.get('wetness', 'N/A')}")
+            print(f"  Fire Resistance: {player_data.get('fire_resistance', 'N/A')}")
+            print(f"  Obsidian Armor: {player_data.get('has_obsidian_armor', 'N/A')}")
+            print(f"  Current Area: {player_data.get('current_area', 'N/A')}")
+        
+        # Count enemies by type
+        if 'enemy_spawn' in categories:
+            enemy_types = {}
+            for entry in categories['enemy_spawn']:
+                enemy_type = entry['data'].get('type', 'unknown')
+                if enemy_type not in enemy_types:
+                    enemy_types[enemy_type] = 0
+                enemy_types[enemy_type] += 1
+                
+            print(f"\nEnemy Distribution:")
+            for enemy_type, count in enemy_types.items():
+                print(f"  {enemy_type}: {count}")
+        
+        # Combat statistics
+        if 'combat' in categories:
+            combat_events = categories['combat']
+            damage_dealt = sum(event['data'].get('actual_damage', 0) for event in combat_events 
+                              if event['data'].get('attacker') == 'player')
+            damage_taken = sum(event['data'].get('actual_damage', 0) for event in combat_events 
+                              if event['data'].get('defender') == 'player')
+                              
+            print(f"\nCombat Statistics:")
+            print(f"  Total combat events: {len(combat_events)}")
+            print(f"  Player damage dealt: {damage_dealt}")
+            print(f"  Player damage taken: {damage_taken}")
     else:
-        print(f"Snapshot file not found: {snapshot_file}")
+        print(f"Snapshot not found: {snapshot_file}")
 
 def organize_legacy_logs():
     """Organize legacy logs into the new directory structure."""
@@ -493,8 +515,11 @@ def organize_legacy_logs():
     logs_dir = game_logger.log_directory
     
     # Find legacy log files
-    log_files = [f for f in os.listdir(logs_dir) if f.endswith('.log') and os.path.isfile(os.path.join(logs_dir, f))]
-    snapshot_files = [f for f in os.listdir(logs_dir) if f.startswith('snapshot_') and f.endswith('.json') and os.path.isfile(os.path.join(logs_dir, f))]
+    # One pass over the directory; DirEntry knows its type without a stat
+    with os.scandir(logs_dir) as it:
+        file_names = [entry.name for entry in it if entry.is_file()]
+    log_files = [f for f in file_names if f.endswith('.log')]
+    snapshot_files = [f for f in file_names if f.startswith('snapshot_') and f.endswith('.json')]
     
     # Group files by session
     session_files = {}
@@ -602,21 +627,12 @@ def detect_health_damage_patterns(session_id=None):
     # Get session directory
     sessions_dir = os.path.join('logs', 'sessions')
     session_dir = os.path.join(sessions_dir, session_id)
-    snapshots_dir = os.path.join(session_dir, 'snapshots')
     
-    if not os.path.exists(snapshots_dir):
-        print(f"No snapshots found for session {session_id}")
-        return None
-    
-    # Get all snapshot files in chronological order
-    snapshot_files = sorted([
-        os.path.join(snapshots_dir, f)
-        for f in os.listdir(snapshots_dir)
-        if f.endswith('.json')
-    ])
+    # Get all snapshots in chronological order
+    snapshots = load_session_snapshots(session_dir)
     
-    if not snapshot_files:
-        print("No snapshots found")
+    if not snapshots:
+        print(f"No snapshots found for session {session_id}")
         return None
     
     # Collect event files if they exist
@@ -652,41 +668,35 @@ def detect_health_damage_patterns(session_id=None):
     fire_resistance_values = []
     
     # Process snapshots
-    for snapshot_file in snapshot_files:
+    for timestamp, snapshot in snapshots:
         try:
-            with open(os.path.join(snapshots_dir, snapshot_file), 'r') as f:
-                snapshot = json.load(f)
+            # Process player data
+            if 'player' in snapshot:
+                player = snapshot['player']
+                if 'health' in player:
+                    health_changes.append((timestamp, player['health']))
                 
-                # Extract timestamp from filename (snapshot_TIMESTAMP.json)
-                timestamp = snapshot_file.replace('snapshot_', '').replace('.json', '')
+                if 'wetness' in player:
+                    wetness_values.append((timestamp, player['wetness']))
                 
-                # Process player data
-                if 'player' in snapshot:
-                    player = snapshot['player']
-                    if 'health' in player:
-                        health_changes.append((timestamp, player['health']))
-                    
-                    if 'wetness' in player:
-                        wetness_values.append((timestamp, player['wetness']))
-                    
-                    if 'fire_resistance' in player:
-                        fire_resistance_values.append((timestamp, player['fire_resistance']))
-                
-                # Process area data
-                if 'environment' in snapshot and 'current_area' in snapshot['environment']:
-                    area = snapshot['environment']['current_area']
-                    areas_visited.add(area)
-                
-                # Process enemy data
-                if 'enemies' in snapshot:
-                    for enemy in snapshot['enemies']:
-                        enemy_type = enemy.get('type', 'Unknown')
-                        if enemy_type not in enemy_data:
-                            enemy_data[enemy_type] = 0
-                        enemy_data[enemy_type] += 1
-        
+                if 'fire_resistance' in player:
+                    fire_resistance_values.append((timestamp, player['fire_resistance']))
+            
+            # Process area data
+            if 'environment' in snapshot and 'current_area' in snapshot['environment']:
+                area = snapshot['environment']['current_area']
+                areas_visited.add(area)
+            
+            # Process enemy data
+            if 'enemies' in snapshot:
+                for enemy in snapshot['enemies']:
+                    enemy_type = enemy.get('type', 'Unknown')
+                    if enemy_type not in enemy_data:
+                        enemy_data[enemy_type] = 0
+                    enemy_data[enemy_type] += 1
+    
         except Exception as e:
-            print(f"Error processing snapshot {snapshot_file}: {e}")
+            print(f"Error processing snapshot {timestamp}: {e}")
     
     # Process events to find damage sources
     for event_file in event_files:
@@ -766,7 +776,7 @@ Session ID: {session_id}
 Start Time: {session_start_time}
 Duration: {session_duration}
 Areas Visited: {', '.join(areas_visited)}
-Snapshots Captured: {len(snapshot_files)}
+Snapshots Captured: {len(snapshots)}
 Events Recorded: {len(event_files)}
 
 [PLAYER ANALYSIS]
@@ -929,17 +939,13 @@ def generate_compressed_log_report(session_id=None):
         return f"Session directory not found: {session_dir}"
     
     # Load session data
-    snapshots_dir = os.path.join(session_dir, "snapshots")
     events_dir = os.path.join(session_dir, "events")
     
-    if not os.path.exists(snapshots_dir):
-        return f"No snapshots found for session: {session_id}"
-    
-    # Collect all snapshot files
-    snapshot_files = sorted([f for f in os.listdir(snapshots_dir) if f.endswith('.json')])
+    # Collect all snapshots
+    snapshots = load_session_snapshots(session_dir)
     
-    if not snapshot_files:
-        return f"No snapshot data found for session: {session_id}"
+    if not snapshots:
+        return f"No snapshots found for session: {session_id}"
     
     # Collect event files if they exist
     event_files = []
@@ -973,41 +979,35 @@ def generate_compressed_log_report(session_id=None):
     fire_resistance_values = []
     
     # Process snapshots
-    for snapshot_file in snapshot_files:
+    for timestamp, snapshot in snapshots:
         try:
-            with open(os.path.join(snapshots_dir, snapshot_file), 'r') as f:
-                snapshot = json.load(f)
-                
-                # Extract timestamp from filename (snapshot_TIMESTAMP.json)
-                timestamp = snapshot_file.replace('snapshot_', '').replace('.json', '')
-                
-                # Process player data
-                if 'player' in snapshot:
-                    player = snapshot['player']
-                    if 'health' in player:
-                        health_changes.append((timestamp, player['health']))
-                    
-                    if 'wetness' in player:
-                        wetness_values.append((timestamp, player['wetness']))
-                    
-                    if 'fire_resistance' in player:
-                        fire_resistance_values.append((timestamp, player['fire_resistance']))
+            # Process player data
+            if 'player' in snapshot:
+                player = snapshot['player']
+                if 'health' in player:
+                    health_changes.append((timestamp, player['health']))
                 
-                # Process area data
-                if 'environment' in snapshot and 'current_area' in snapshot['environment']:
-                    area = snapshot['environment']['current_area']
-                    areas_visited.add(area)
+                if 'wetness' in player:
+                    wetness_values.append((timestamp, player['wetness']))
                 
-                # Process enemy data
-                if 'enemies' in snapshot:
-                    for enemy in snapshot['enemies']:
-                        enemy_type = enemy.get('type', 'Unknown')
-                        if enemy_type not in enemy_data:
-                            enemy_data[enemy_type] = 0
-                        enemy_data[enemy_type] += 1
-        
+                if 'fire_resistance' in player:
+                    fire_resistance_values.append((timestamp, player['fire_resistance']))
+            
+            # Process area data
+            if 'environment' in snapshot and 'current_area' in snapshot['environment']:
+                area = snapshot['environment']['current_area']
+                areas_visited.add(area)
+            
+            # Process enemy data
+            if 'enemies' in snapshot:
+                for enemy in snapshot['enemies']:
+                    enemy_type = enemy.get('type', 'Unknown')
+                    if enemy_type not in enemy_data:
+                        enemy_data[enemy_type] = 0
+                    enemy_data[enemy_type] += 1
+    
         except Exception as e:
-            print(f"Error processing snapshot {snapshot_file}: {e}")
+            print(f"Error processing snapshot {timestamp}: {e}")
     
     # Process events to find damage sources
     for event_file in event_files:
@@ -1087,7 +1087,7 @@ Session ID: {session_id}
 Start Time: {session_start_time}
 Duration: {session_duration}
 Areas Visited: {', '.join(areas_visited)}
-Snapshots Captured: {len(snapshot_files)}
+Snapshots Captured: {len(snapshots)}
 Events Recorded: {len(event_files)}
 
 [PLAYER ANALYSIS]
@@ -1367,15 +1367,11 @@ def analyze_cross_session_patterns():
             continue
         
         # Get snapshots and events
-        snapshots_dir = os.path.join(session_dir, "snapshots")
         events_dir = os.path.join(session_dir, "events")
         
-        if not os.path.exists(snapshots_dir):
-            continue
-            
-        # Collect snapshot files
-        snapshot_files = sorted([f for f in os.listdir(snapshots_dir) if f.endswith('.json')])
-        if not snapshot_files:
+        # Collect snapshots
+        snapshots = load_session_snapshots(session_dir)
+        if not snapshots:
             continue
             
         # Collect event files
@@ -1405,36 +1401,33 @@ def analyze_cross_session_patterns():
             'max_fire_resistance': 0,
             'damage_taken': 0,
             'enemies_encountered': 0,
-            'snapshot_count': len(snapshot_files),
+            'snapshot_count': len(snapshots),
             'event_count': len(event_files)
         }
         
         # Process snapshots for this session
-        for snapshot_file in snapshot_files:
+        for _, snapshot in snapshots:
             try:
-                with open(os.path.join(snapshots_dir, snapshot_file), 'r') as f:
-                    snapshot = json.load(f)
+                # Track areas visited
+                if 'environment' in snapshot and 'current_area' in snapshot['environment']:
+                    area = snapshot['environment']['current_area']
+                    session_data['areas'].add(area)
                     
-                    # Track areas visited
-                    if 'environment' in snapshot and 'current_area' in snapshot['environment']:
-                        area = snapshot['environment']['current_area']
-                        session_data['areas'].add(area)
+                # Track player stats
+                if 'player' in snapshot:
+                    player = snapshot['player']
+                    if 'health' in player and player['health'] > session_data['max_health']:
+                        session_data['max_health'] = player['health']
+                        
+                    if 'wetness' in player and player['wetness'] > session_data['max_wetness']:
+                        session_data['max_wetness'] = player['wetness']
                         
-                    # Track player stats
-                    if 'player' in snapshot:
-                        player = snapshot['player']
-                        if 'health' in player and player['health'] > session_data['max_health']:
-                            session_data['max_health'] = player['health']
-                            
-                        if 'wetness' in player and player['wetness'] > session_data['max_wetness']:
-                            session_data['max_wetness'] = player['wetness']
-                            
-                        if 'fire_resistance' in player and player['fire_resistance'] > session_data['max_fire_resistance']:
-                            session_data['max_fire_resistance'] = player['fire_resistance']
-                            
-                    # Count enemies
-                    if 'enemies' in snapshot:
-                        session_data['enemies_encountered'] += len(snapshot['enemies'])
+                    if 'fire_resistance' in player and player['fire_resistance'] > session_data['max_fire_resistance']:
+                        session_data['max_fire_resistance'] = player['fire_resistance']
+                        
+                # Count enemies
+                if 'enemies' in snapshot:
+                    session_data['enemies_encountered'] += len(snapshot['enemies'])
             except Exception:
                 continue
                 
@@ -15,6 +15,7 @@ The analyzer can:
 import os
 import json
 import glob
+import heapq
 import time
 import datetime
 from collections import defaultdict
@@ -23,7 +24,7 @@ from typing import Dict, List, Any, Tuple, Optional, Set
 # Import from parent directory
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from logger import game_logger
+from logger import game_logger, read_session_journal
 
 
 class SnapshotAnalyzer:
@@ -49,14 +50,19 @@ class SnapshotAnalyzer:
         Returns:
             Number of sessions loaded
         """
-        session_paths = glob.glob(os.path.join(self.sessions_dir, 'session_*'))
+        if not os.path.isdir(self.sessions_dir):
+            return len(self.sessions)
+        with os.scandir(self.sessions_dir) as it:
+            session_entries = [entry for entry in it if entry.name.startswith('session_')]
         
-        # Sort by creation time (newest or oldest first)
-        session_paths.sort(key=os.path.getctime, reverse=most_recent)
-        
-        # Limit the number of sessions if specified
+        # Sort by creation time (newest or oldest first). DirEntry caches its stat, and
+        # a limit only needs the first few, not a full sort.
         if limit:
-            session_paths = session_paths[:limit]
+            select = heapq.nlargest if most_recent else heapq.nsmallest
+            session_entries = select(limit, session_entries, key=lambda e: e.stat().st_ctime)
+        else:
+            session_entries.sort(key=lambda e: e.stat().st_ctime, reverse=most_recent)
+        session_paths = [entry.path for entry in session_entries]
         
         # Load each session
         for session_path in session_paths:
@@ -99,14 +105,15 @@ class SnapshotAnalyzer:
         session = self.sessions[session_id]
         snapshot_dir = os.path.join(session['path'], 'snapshots')
         
-        if not os.path.exists(snapshot_dir):
-            print(f"No snapshots directory found for session {session_id}")
+        # Newer sessions append snapshots to a journal; older ones have one file each
+        snapshots = read_session_journal(session['path'], 'snapshot')
+        snapshot_files = glob.glob(os.path.join(snapshot_dir, '*.json'))
+        
+        if not snapshots and not snapshot_files:
+            print(f"No snapshots found for session {session_id}")
             return 0
             
         # Load all snapshot files
-        snapshot_files = glob.glob(os.path.join(snapshot_dir, '*.json'))
-        snapshots = []
-        
         for snapshot_file in snapshot_files:
             try:
                 with open(snapshot_file, 'r') as f:
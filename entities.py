@@ -1,13 +1,14 @@
 import pygame
 import random
 import math
-from logger import game_logger
+from logger import game_logger, log_id
 import time
 import sys
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
+        log_id(self)  # Assign the stable ID used in every log entry about this sprite
         self.image = pygame.Surface((40, 40))
         self.image.fill((0, 0, 255))  # Blue player
         self.rect = self.image.get_rect()
@@ -64,7 +65,7 @@ class Player(pygame.sprite.Sprite):
             "fire_resistance": self.fire_resistance,
             "obsidian_armor": self.obsidian_armor_level,
             "current_area": self.current_area,
-            "session_id": id(self),
+            "session_id": self._log_id,
             "memory_size": sys.getsizeof(self)
         }, "high")
         
@@ -142,7 +143,7 @@ class Player(pygame.sprite.Sprite):
         
         # Update total movement for progression tracking
         if dx != 0 or dy != 0:
-            movement_distance = math.sqrt(dx*dx + dy*dy)
+            movement_distance = math.hypot(dx, dy)
             self.progression["total_movement"] += movement_distance
         
         # Log position after movement
@@ -289,7 +290,7 @@ class Player(pygame.sprite.Sprite):
         
         # Log attack initiation
         game_logger.debug("STATE_player_attack_initiate", {
-            "target_enemy_id": id(enemy),
+            "target_enemy_id": log_id(enemy),
             "target_enemy_type": enemy.type,
             "base_damage": base_damage,
             "player_position": {"x": self.rect.x, "y": self.rect.y},
@@ -329,7 +330,7 @@ class Player(pygame.sprite.Sprite):
         
         # Log attack result
         game_logger.debug("STATE_player_attack_result", {
-            "target_enemy_id": id(enemy),
+            "target_enemy_id": log_id(enemy),
             "target_enemy_type": enemy.type, 
             "damage_attempted": base_damage,
             "damage_dealt": damage_dealt["actual_damage"],
@@ -345,6 +346,7 @@ class Player(pygame.sprite.Sprite):
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x, y, area="BEACH"):
         super().__init__()
+        log_id(self)  # Assign the stable ID used in every log entry about this sprite
         self.area = area
         self.type = "generic"
         
@@ -416,7 +418,7 @@ class Enemy(pygame.sprite.Sprite):
             
             # Log direction change
             game_logger.debug("DEV_enemy_direction_change", {
-                "enemy_id": id(self),
+                "enemy_id": self._log_id,
                 "enemy_type": self.type,
                 "old_direction": old_direction,
                 "new_direction": self.direction,
@@ -427,7 +429,7 @@ class Enemy(pygame.sprite.Sprite):
         # Calculate distance to player
         dx_to_player = player.rect.x - self.rect.x
         dy_to_player = player.rect.y - self.rect.y
-        distance_to_player = math.sqrt(dx_to_player**2 + dy_to_player**2)
+        distance_to_player = math.hypot(dx_to_player, dy_to_player)
         
         # Basic AI: move toward player with some randomness
         move_toward_player = False
@@ -441,7 +443,7 @@ class Enemy(pygame.sprite.Sprite):
             # Log AI decision to move toward player
             if old_direction != self.direction:
                 game_logger.debug("DEV_enemy_ai_decision", {
-                    "enemy_id": id(self),
+                    "enemy_id": self._log_id,
                     "enemy_type": self.type,
                     "decision": "move_toward_player",
                     "old_direction": old_direction,
@@ -461,7 +463,7 @@ class Enemy(pygame.sprite.Sprite):
         # Log movement details if position changed
         if pre_pos["x"] != self.rect.x or pre_pos["y"] != self.rect.y:
             game_logger.debug("DEV_enemy_movement", {
-                "enemy_id": id(self),
+                "enemy_id": self._log_id,
                 "enemy_type": self.type,
                 "old_position": pre_pos,
                 "new_position": {"x": self.rect.x, "y": self.rect.y},
@@ -481,7 +483,7 @@ class Enemy(pygame.sprite.Sprite):
         # Log boundary correction if needed
         if orig_x != self.rect.x or orig_y != self.rect.y:
             game_logger.debug("DEV_enemy_boundary_correction", {
-                "enemy_id": id(self),
+                "enemy_id": self._log_id,
                 "enemy_type": self.type,
                 "attempted_position": {"x": orig_x, "y": orig_y},
                 "corrected_position": {"x": self.rect.x, "y": self.rect.y}
@@ -493,7 +495,7 @@ class Enemy(pygame.sprite.Sprite):
         # Log collision detection
         if collision:
             game_logger.debug("DEV_enemy_player_collision", {
-                "enemy_id": id(self),
+                "enemy_id": self._log_id,
                 "enemy_type": self.type,
                 "enemy_position": {"x": self.rect.x, "y": self.rect.y},
                 "player_position": {"x": player.rect.x, "y": player.rect.y},
@@ -520,7 +522,7 @@ class Enemy(pygame.sprite.Sprite):
         # Log damage
         game_logger.debug("DEV_enemy_damage", {
             "enemy_type": self.type,
-            "enemy_id": id(self),
+            "enemy_id": self._log_id,
             "damage": amount,
             "health_remaining": self.health,
             "defeated": self.health <= 0
@@ -532,7 +534,7 @@ class Enemy(pygame.sprite.Sprite):
         """Attack the player"""
         # Log attack initiation
         game_logger.debug("DEV_enemy_attack_initiate", {
-            "enemy_id": id(self),
+            "enemy_id": self._log_id,
             "enemy_type": self.type,
             "damage_type": self.damage_type,
             "base_damage": self.damage,
@@ -573,7 +575,7 @@ class Enemy(pygame.sprite.Sprite):
             # Attack missed
             game_logger.debug("DEV_attack_missed", {
                 "attacker": self.type,
-                "attacker_id": id(self),
+                "attacker_id": self._log_id,
                 "target": "player",
                 "roll": roll,
                 "hit_chance": hit_chance,
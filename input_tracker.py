@@ -12,18 +12,67 @@ Features:
 5. Integrates seamlessly with the game's existing logging framework
 
 Usage:
-    from input_tracker import InputTracker
+    from input_tracker import InputTracker, FrameInputCache
     
     # Initialize in game class
-    self.input_tracker = InputTracker(game_logger)
+    self.frame_input = FrameInputCache()
+    self.input_tracker = InputTracker(game_logger, self.frame_input)
     
-    # Update every frame in main loop
+    # Refresh the shared input state once per frame, then update the tracker
+    self.frame_input.tick()
     self.input_tracker.update()
 """
 
 import pygame
 import time
-from logger import game_logger
+import numpy as np
+
+def _scancode_key_map(key_count):
+    """Map indices of the pressed-key array to (key code, key name) pairs.
+    
+    In pygame 2, pygame.key.get_pressed() is indexed by SDL scancode, while the
+    K_* constants and pygame.key.name() use key codes. A ScancodeWrapper looks up
+    the scancode of the key code it is indexed with, so indexing one that holds
+    0..key_count-1 with every key constant gives the inverse mapping. The result
+    follows the active keyboard layout, so build it after pygame is initialized.
+    """
+    probe = pygame.key.ScancodeWrapper(range(key_count))
+    key_map = {}
+    for name in dir(pygame):
+        if not name.startswith("K_"):
+            continue
+        key_code = getattr(pygame, name)
+        try:
+            scancode = probe[key_code]
+        except IndexError:
+            continue
+        # Scancode 0 is SDL_SCANCODE_UNKNOWN
+        if scancode and scancode not in key_map:
+            key_name = pygame.key.name(key_code)
+            if key_name:
+                key_map[scancode] = (key_code, key_name)
+    return key_map
+
+class FrameInputCache:
+    """
+    Per-frame snapshot of the keyboard and mouse state.
+    
+    Each pygame.key/pygame.mouse query goes through SDL, so subsystems that need the
+    input state in the same frame share one cache instead of querying repeatedly.
+    Call tick() once per frame, after the event queue has been pumped.
+    """
+    
+    def __init__(self):
+        """Initialize an empty cache; values are populated by tick()."""
+        self.keys = ()
+        self.mouse_pos = (0, 0)
+        self.mouse_buttons = (False, False, False)
+    
+    def tick(self):
+        """Refresh the cached input state for the current frame."""
+        self.keys = pygame.key.get_pressed()
+        self.mouse_pos = pygame.mouse.get_pos()
+        self.mouse_buttons = pygame.mouse.get_pressed()
 
 class InputTracker:
     """
@@ -33,19 +82,27 @@ class InputTracker:
     ensuring comprehensive input tracking without excessive log volume.
     """
     
-    def __init__(self, logger):
-        """Initialize the input tracker with its own logger instance."""
+    def __init__(self, logger, input_cache=None):
+        """Initialize the input tracker with its own logger instance.
+        
+        If an input_cache is given, the owner is responsible for ticking it each
+        frame; otherwise the tracker keeps a private cache and ticks it itself.
+        """
         self.logger = logger
+        self.input_cache = input_cache or FrameInputCache()
+        self._owns_input_cache = input_cache is None
         
         # Initialize previous input states
-        self.prev_keys = {}
         self.prev_mouse_pos = (0, 0)
         self.prev_mouse_buttons = [False, False, False]  # Left, Middle, Right
         
-        # For keyboard tracking, we'll initialize with all keys as released
-        for key_constant in range(pygame.K_FIRST, pygame.K_LAST + 1):
-            self.prev_keys[key_constant] = False
-            
+        # Keyboard state packed into uint64 words (bit i = state of scancode i), so
+        # a frame-to-frame diff is one XOR per 64 keys. Sized on the first update.
+        self._key_bits = None
+        self._prev_words = None
+        # Scancode -> (key code, key name), built when first needed
+        self._scancode_keys = None
+        
         # Track when we last logged a complete input state snapshot
         self.last_full_snapshot_time = 0
         self.full_snapshot_interval = 5.0  # Log full state every 5 seconds
@@ -53,7 +110,7 @@ class InputTracker:
         # Log creation
         self.logger.debug("INPUT_TRACKER_INITIALIZED", {
             "timestamp": time.time(),
-            "tracked_keys": len(self.prev_keys),
+            "tracked_keys": len(pygame.key.get_pressed()),
             "mouse_tracking": True
         }, "normal")
     
@@ -66,22 +123,27 @@ class InputTracker:
         current_time = time.time()
         
         # Get current input states
-        current_keys = pygame.key.get_pressed()
-        current_mouse_pos = pygame.mouse.get_pos()
-        current_mouse_buttons = pygame.mouse.get_pressed()
+        if self._owns_input_cache:
+            self.input_cache.tick()
+        current_keys = self.input_cache.keys
+        current_mouse_pos = self.input_cache.mouse_pos
+        current_mouse_buttons = self.input_cache.mouse_buttons
         
         # Check for changes in keyboard state
+        curr_words = self._pack_key_states(current_keys)
+        diff = curr_words ^ self._prev_words
         key_changes = {}
-        for key_constant in range(pygame.K_FIRST, pygame.K_LAST + 1):
-            # Skip keys that don't exist or are out of range
-            if key_constant >= len(current_keys):
-                continue
-                
-            current_state = bool(current_keys[key_constant])
-            if current_state != self.prev_keys.get(key_constant, False):
-                # State changed, record it
-                key_changes[key_constant] = current_state
-                self.prev_keys[key_constant] = current_state
+        if diff.any():
+            for word_index in np.flatnonzero(diff):
+                changed = int(diff[word_index])
+                current_word = int(curr_words[word_index])
+                base = int(word_index) * 64
+                # Walk only the set bits of the changed mask
+                while changed:
+                    lowest = changed & -changed
+                    key_changes[base + lowest.bit_length() - 1] = bool(current_word & lowest)
+                    changed ^= lowest
+            self._prev_words = curr_words
         
         # Check for mouse position changes
         mouse_pos_changed = current_mouse_pos != self.prev_mouse_pos
@@ -105,14 +167,17 @@ class InputTracker:
                 "frame_delta": current_time - self.last_full_snapshot_time if self.last_full_snapshot_time > 0 else 0
             }
             
-            # Add key changes if any
+            # Add key changes if any, translating scancodes to key codes and names
             if key_changes:
-                key_names = {key: pygame.key.name(key) for key in key_changes.keys()}
-                log_data["key_changes"] = [{
-                    "key_code": k, 
-                    "key_name": key_names.get(k, f"Unknown-{k}"),
-                    "pressed": v
-                } for k, v in key_changes.items()]
+                scancode_keys = self._get_scancode_keys(len(current_keys))
+                log_data["key_changes"] = []
+                for scancode, pressed in key_changes.items():
+                    key_code, key_name = scancode_keys.get(scancode, (None, f"Unknown-{scancode}"))
+                    log_data["key_changes"].append({
+                        "key_code": key_code,
+                        "key_name": key_name,
+                        "pressed": pressed
+                    })
             
             # Add mouse position if changed
             if mouse_pos_changed:
@@ -139,17 +204,36 @@ class InputTracker:
             self._log_full_snapshot(current_time, current_keys, current_mouse_pos, current_mouse_buttons)
             self.last_full_snapshot_time = current_time
     
+    def _get_scancode_keys(self, key_count):
+        """Return the scancode -> (key code, key name) map, building it on first use."""
+        if self._scancode_keys is None:
+            self._scancode_keys = _scancode_key_map(key_count)
+        return self._scancode_keys
+    
+    def _pack_key_states(self, current_keys):
+        """Pack the pressed-key flags into little-endian uint64 words."""
+        key_count = len(current_keys)
+        if self._key_bits is None or len(self._key_bits) < key_count:
+            word_count = (key_count + 63) // 64
+            self._key_bits = np.zeros(word_count * 64, dtype=np.uint8)
+            self._prev_words = np.zeros(word_count, dtype="<u8")
+        
+        self._key_bits[:key_count] = current_keys
+        return np.packbits(self._key_bits, bitorder="little").view("<u8")
+    
     def _log_full_snapshot(self, current_time, current_keys, current_mouse_pos, current_mouse_buttons):
         """Log the complete input state periodically as a reference snapshot."""
-        # Get all pressed keys for the snapshot
+        # Get all pressed keys for the snapshot. The pressed array is indexed by
+        # scancode, so each pressed index is translated to its key code and name.
+        scancode_keys = self._get_scancode_keys(len(current_keys))
         pressed_keys = []
-        for key_constant in range(pygame.K_FIRST, pygame.K_LAST + 1):
-            if key_constant < len(current_keys) and current_keys[key_constant]:
-                key_name = pygame.key.name(key_constant)
-                if key_name:  # Only include valid keys
+        for scancode, pressed in enumerate(current_keys):
+            if pressed:
+                key = scancode_keys.get(scancode)
+                if key:  # Only include valid keys
                     pressed_keys.append({
-                        "key_code": key_constant,
-                        "key_name": key_name
+                        "key_code": key[0],
+                        "key_name": key[1]
                     })
         
         # Create snapshot with current mouse and keyboard state
@@ -12,8 +12,10 @@ import os
 import sys
 import pygame
 import subprocess
+import threading
 import time
 from typing import Dict, List, Any, Tuple
+from input_tracker import FrameInputCache
 
 # Initialize pygame
 pygame.init()
@@ -31,6 +33,9 @@ HIGHLIGHT_COLOR = (255, 215, 0)  # Gold
 BUTTON_WIDTH, BUTTON_HEIGHT = 300, 60
 BUTTON_MARGIN = 20
 
+# Posted by the spawn thread once a child process has started (or failed to start)
+LAUNCH_RESULT_EVENT = pygame.USEREVENT + 1
+
 
 class Button:
     """Interactive button for the launcher UI."""
@@ -80,6 +85,7 @@ class Launcher:
         
         self.clock = pygame.time.Clock()
         self.running = True
+        self.frame_input = FrameInputCache()
         
         # Create fonts
         self.title_font = pygame.font.SysFont(None, 64)
@@ -128,11 +134,15 @@ class Launcher:
         self.status_message = ""
         self.status_color = TEXT_COLOR
         self.status_time = 0
+        
+        # Set while a game launch is in flight so repeated clicks don't spawn twice
+        self.launch_pending = False
     
     def run(self):
         """Run the launcher main loop."""
         while self.running:
-            mouse_pos = pygame.mouse.get_pos()
+            self.frame_input.tick()
+            mouse_pos = self.frame_input.mouse_pos
             
             # Handle events
             for event in pygame.event.get():
@@ -143,6 +153,9 @@ class Launcher:
                     for button in self.buttons:
                         if button.handle_click():
                             break
+                
+                elif event.type == LAUNCH_RESULT_EVENT:
+                    self.handle_launch_result(event)
             
             # Update buttons
             for button in self.buttons:
@@ -186,49 +199,75 @@ class Launcher:
         self.status_color = color
         self.status_time = time.time()
     
+    def spawn_process(self, args: List[str], error_prefix: str,
+                      env: Dict[str, str] = None, exit_on_success: bool = False):
+        """Start a child process on a worker thread so the launcher stays responsive.
+        
+        Process creation can take a noticeable amount of time (especially on Windows),
+        so it happens off the UI thread. The outcome is posted back to the main loop
+        as a LAUNCH_RESULT_EVENT, where launcher state is safely updated.
+        """
+        if exit_on_success:
+            if self.launch_pending:
+                return
+            self.launch_pending = True
+        
+        def spawn():
+            error = None
+            try:
+                subprocess.Popen(args, env=env)
+            except Exception as e:
+                error = str(e)
+            pygame.event.post(pygame.event.Event(
+                LAUNCH_RESULT_EVENT,
+                error=error,
+                error_prefix=error_prefix,
+                exit_on_success=exit_on_success
+            ))
+        
+        threading.Thread(target=spawn, daemon=True).start()
+    
+    def handle_launch_result(self, event: pygame.event.Event):
+        """Apply the result of a spawn_process call on the main thread."""
+        if event.exit_on_success:
+            self.launch_pending = False
+        
+        if event.error:
+            self.set_status(f"{event.error_prefix}: {event.error}", (255, 100, 100))
+        elif event.exit_on_success:
+            # Exit the launcher once the game is running
+            self.running = False
+    
     def start_standard_game(self):
         """Launch the standard game mode."""
         self.set_status("Starting standard game...", (100, 255, 100))
         
-        try:
-            # Create and set environment variable for standard mode
-            env = os.environ.copy()
-            env["ELEMENTAL_GAME_MODE"] = "standard"
-            
-            # Launch the game in a separate process
-            subprocess.Popen([sys.executable, "main.py"], env=env)
-            
-            # Exit the launcher
-            self.running = False
-        except Exception as e:
-            self.set_status(f"Error starting game: {e}", (255, 100, 100))
+        # Create and set environment variable for standard mode
+        env = os.environ.copy()
+        env["ELEMENTAL_GAME_MODE"] = "standard"
+        
+        # Launch the game in a separate process
+        self.spawn_process([sys.executable, "main.py"], "Error starting game",
+                           env=env, exit_on_success=True)
     
     def start_dev_tutorial(self):
         """Launch the game in development tutorial mode."""
         self.set_status("Starting development tutorial...", (100, 255, 100))
         
-        try:
-            # Create and set environment variable for dev mode
-            env = os.environ.copy()
-            env["ELEMENTAL_GAME_MODE"] = "dev"
-            
-            # Launch the game in a separate process
-            subprocess.Popen([sys.executable, "main.py"], env=env)
-            
-            # Exit the launcher
-            self.running = False
-        except Exception as e:
-            self.set_status(f"Error starting dev tutorial: {e}", (255, 100, 100))
+        # Create and set environment variable for dev mode
+        env = os.environ.copy()
+        env["ELEMENTAL_GAME_MODE"] = "dev"
+        
+        # Launch the game in a separate process
+        self.spawn_process([sys.executable, "main.py"], "Error starting dev tutorial",
+                           env=env, exit_on_success=True)
     
     def analyze_logs(self):
         """Launch the log analyzer."""
         self.set_status("Opening log analyzer...", (100, 255, 100))
         
-        try:
-            # Launch the analyzer in a separate process
-            subprocess.Popen([sys.executable, "analyze_logs.py"])
-        except Exception as e:
-            self.set_status(f"Error opening analyzer: {e}", (255, 100, 100))
+        # Launch the analyzer in a separate process
+        self.spawn_process([sys.executable, "analyze_logs.py"], "Error opening analyzer")
     
     def exit_launcher(self):
         """Exit the launcher."""
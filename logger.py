@@ -36,19 +36,79 @@ Date: March 2025
 """
 
 import time
+import array
 import json
 from json import JSONEncoder
 import os
 import gzip
-import base64
+import heapq
+import io
+import itertools
 import pickle
+import queue
+import collections
+import operator
+import random
 import atexit
-import shutil
-from datetime import datetime
 from loguru import logger
 import threading
 import sys
 
+try:
+    import orjson
+except ImportError:  # Optional: JSON falls back to the stdlib encoder without it
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:  # Optional: log chunks fall back to gzip without it
+    zstd = None
+
+try:
+    import msgpack
+except ImportError:  # Optional: log chunks fall back to pickle payloads without it
+    msgpack = None
+
+# File extension used for log cache chunks by compression scheme
+CHUNK_EXTENSIONS = {"zstd": ".zst", "gzip": ".gz", "none": ".bin"}
+CHUNK_SUFFIXES = tuple(CHUNK_EXTENSIONS.values())
+
+# Session manifest fields that don't change for the life of the process
+_STATIC_MANIFEST = {
+    "python_version": sys.version,
+    "platform": sys.platform,
+    "executable": sys.executable,
+    "game_version": "0.1.0",  # Should be pulled from game config
+}
+
+# Source of small integer IDs for logged entities (see log_id)
+_LOG_ID_COUNTER = itertools.count(1)
+
+def log_id(entity):
+    """Return the logging ID for an entity, assigning one on first use.
+    
+    Unlike id(), these are small integers that are never reused within a session,
+    so they stay meaningful once logs are serialized and analyzed later.
+    """
+    try:
+        return entity._log_id
+    except AttributeError:
+        entity._log_id = next(_LOG_ID_COUNTER)
+        return entity._log_id
+
+# Priorities that force an immediate flush and are echoed through loguru
+_HIGH_PRIORITIES = frozenset(("high", "critical"))
+
+# loguru loggers whose message arguments are callables, evaluated only if some sink
+# accepts the record. opt() builds a new logger each call, so these are made once.
+_lazy_logger = logger.opt(lazy=True)
+
+# Fields an embedded duplet shares with its snapshot, stored only on the snapshot
+_DUPLET_SHARED_FIELDS = ("timestamp", "snapshot_time", "session_id")
+
+# Sort key for (timestamp, category, data, priority) log rows
+_row_timestamp = operator.itemgetter(0)
+
 class CustomJSONEncoder(JSONEncoder):
     """Custom JSON encoder that handles special Python types like sets."""
     def default(self, obj):
@@ -59,6 +119,236 @@ class CustomJSONEncoder(JSONEncoder):
         except TypeError:
             return str(obj)  # Fall back to string representation for other complex types
 
+def _json_default(obj):
+    """Encode types JSON can't handle natively, mirroring CustomJSONEncoder.default."""
+    if isinstance(obj, set):
+        return list(obj)  # Convert sets to lists
+    return str(obj)  # Fall back to string representation for other complex types
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Stdlib fallback encoders, built once so each call takes the C-accelerated path
+# instead of instantiating CustomJSONEncoder; compact output matches orjson's.
+_ENCODE = JSONEncoder(default=_json_default, ensure_ascii=False, separators=(",", ":")).encode
+_ENCODE_INDENT = JSONEncoder(default=_json_default, ensure_ascii=False, indent=2).encode
+
+def _json_bytes(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=_json_default, option=option)
+    return (_ENCODE_INDENT if indent else _ENCODE)(obj).encode("utf-8")
+
+def _json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _batches(iterable, size):
+    """Yield lists of up to size items from iterable, like 3.12's itertools.batched."""
+    it = iter(iterable)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+def _write_atomic(path, payload):
+    """Write payload to path through a temporary file and os.replace().
+    
+    Readers in other processes see either the previous file or the complete new
+    one, never a file truncated by a crash mid-write.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _pack_chunk(obj):
+    """Serialize a log chunk payload, using msgpack when it is installed."""
+    if msgpack is not None:
+        return msgpack.packb(obj, use_bin_type=True, default=_json_default)
+    return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _pack_chunk_columns(columns, packed_datas):
+    """Pack a columnar chunk payload from its columns and its already-packed entry data.
+    
+    A msgpack array is its header followed by its packed items, so this gives the
+    same bytes as _pack_chunk on the columns with a "data" column added last.
+    Requires msgpack.
+    """
+    packer = msgpack.Packer(use_bin_type=True, default=_json_default)
+    parts = [packer.pack_map_header(len(columns) + 1)]
+    for key, value in columns.items():
+        parts.append(packer.pack(key))
+        parts.append(packer.pack(value))
+    parts.append(packer.pack("data"))
+    parts.append(packer.pack_array_header(len(packed_datas)))
+    parts.extend(packed_datas)
+    return b"".join(parts)
+
+# msgpack type markers of a top-level map, which is how columnar chunks start
+_MSGPACK_MAP_MARKERS = frozenset(range(0x81, 0x90)) | {0xde, 0xdf}
+
+def _timestamps_to_bytes(timestamps):
+    """Pack an array('d') of timestamps as little-endian doubles."""
+    if sys.byteorder != "little":
+        timestamps = array.array('d', timestamps)
+        timestamps.byteswap()
+    return timestamps.tobytes()
+
+def _timestamps_from_bytes(data):
+    """Unpack little-endian doubles written by _timestamps_to_bytes."""
+    timestamps = array.array('d')
+    timestamps.frombytes(data)
+    if sys.byteorder != "little":
+        timestamps.byteswap()
+    return timestamps
+
+def _iter_chunk_columns(columns, datas):
+    """Rebuild entry dicts from a columnar chunk's columns, in order."""
+    timestamps = _timestamps_from_bytes(columns["timestamp"])
+    for timestamp, category, priority, data in zip(timestamps, columns["category"],
+                                                   columns["priority"], datas):
+        yield {"timestamp": timestamp, "category": category, "data": data, "priority": priority}
+
+# Per-session append-only journal holding snapshots and chunk summaries, one JSON
+# record per line tagged with its "kind"
+JOURNAL_FILENAME = "journal.ndjson"
+
+def read_session_journal(session_dir, kind=None):
+    """Read the records in a session's journal, oldest first.
+    
+    Args:
+        session_dir (str): The session's directory
+        kind (str): If given, only records of this kind ("snapshot" or "chunk") are
+            returned, without their "kind" tag
+        
+    Returns:
+        list: Record dicts; empty if the session has no journal
+    """
+    records = []
+    journal_file = os.path.join(session_dir, JOURNAL_FILENAME)
+    try:
+        with open(journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    record = _json_loads(line)
+                except ValueError:  # A line cut short by a crash mid-write
+                    logger.warning(f"Skipping unreadable record in {journal_file}")
+                    continue
+                if kind is None:
+                    records.append(record)
+                elif record.pop("kind", None) == kind:
+                    records.append(record)
+    except FileNotFoundError:
+        pass
+    return records
+
+# Errors that mean a chunk's payload ends before its last entry
+_CHUNK_EOF_ERRORS = (EOFError, msgpack.OutOfData) if msgpack is not None else (EOFError,)
+
+# Fetches the fixed CSV columns of an entry in one call; entries missing one of
+# them (KeyError) fall back to per-field gets with an empty default
+_csv_base_cells = operator.itemgetter("timestamp", "category", "priority")
+
+# "[category] " line prefixes for flush log messages, encoded once per category.
+# Only used on the writer thread.
+_bulk_log_prefixes = {}
+
+_CSV_SCALAR_TYPES = (int, float, bool)
+# Cell types pandas writes the same way _csv_cell does
+_CSV_PANDAS_TYPES = frozenset((str, int, float, bool, type(None)))
+
+def _csv_cell(value):
+    """Format a log data value for a CSV cell.
+    
+    Strings pass through and scalars use repr(); only nested values are serialized,
+    as JSON so they stay machine-readable. Exact type checks skip isinstance's MRO walk.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value is None:
+        return ""
+    if value_type in _CSV_SCALAR_TYPES:
+        return repr(value)
+    return _json_bytes(value).decode("utf-8")
+
+class _ThreadLogBuffer:
+    """Single-producer/single-consumer ring of log entries owned by one thread.
+    
+    Entries are stored column-wise: four parallel rings hold each entry's timestamp
+    (time.monotonic_ns()), category, data and priority, so appending one is four
+    slot stores with no dict to build. Only the owning thread advances ``tail`` (and fills the slots behind
+    it); only flushes, which are serialized by GameLogger.log_lock, advance ``head``.
+    Each of those updates is atomic under the GIL, so debug() appends without taking
+    any lock. The rings are preallocated; while they are full, new entries are
+    dropped and counted rather than blocking the game thread.
+    
+    Each category is rate-limited with a token bucket; entries over the limit are
+    only counted, in the bucket itself so that costs no further dict lookup. The
+    owner's counters only ever grow and the flush side tracks how
+    much of them it has already reported, so neither side resets the other's state.
+    """
+    __slots__ = ("timestamps", "categories", "datas", "priorities", "mask", "head", "tail",
+                 "dropped", "rate_buckets", "dropped_seen", "suppressed_seen",
+                 "thread")
+    
+    def __init__(self, capacity):
+        # capacity must be a power of two
+        self.timestamps = [None] * capacity
+        self.categories = [None] * capacity
+        self.datas = [None] * capacity
+        self.priorities = [None] * capacity
+        self.mask = capacity - 1
+        self.head = 0  # Next slot to drain; advanced only by flushes
+        self.tail = 0  # Next slot to fill; advanced only by the owner thread
+        
+        # Owner thread only
+        self.dropped = 0  # Entries lost to a full ring
+        # category -> [tokens, last refill ns, entries dropped by the rate limit]
+        self.rate_buckets = {}
+        
+        # Flush side only: how much of the counters above has been reported
+        self.dropped_seen = 0
+        self.suppressed_seen = {}
+        self.thread = threading.current_thread()
+    
+    def peek(self):
+        """Copy every entry between head and tail without consuming them.
+        
+        Must be called with GameLogger.log_lock held. The entries stay in the ring
+        until ``head`` is set to the returned tail.
+        
+        Returns:
+            tuple: ((timestamps, categories, datas, priorities) lists in append
+                order, tail), or None if the ring is empty
+        """
+        head, tail = self.head, self.tail
+        if head == tail:
+            return None
+        start, end = head & self.mask, tail & self.mask
+        if start < end:
+            drained = tuple(ring[start:end] for ring in
+                            (self.timestamps, self.categories, self.datas, self.priorities))
+        else:
+            # Wrapped: extend the tail slice in place rather than concatenating into
+            # a third list
+            drained = []
+            for ring in (self.timestamps, self.categories, self.datas, self.priorities):
+                column = ring[start:]
+                column.extend(ring[:end])
+                drained.append(column)
+            drained = tuple(drained)
+        return drained, tail
+
 class GameLogger:
     def __init__(self, log_directory="logs"):
         """Initialize the game logger with comprehensive debug logging.
@@ -77,31 +367,107 @@ class GameLogger:
             │       ├── manifest.json      # Session metadata
             │       ├── metadata.json      # Session results (created at end)
             │       ├── game_log.log       # Main log file
-            │       ├── snapshots/         # State snapshots taken every second
-            │       ├── duplets/           # Paired snapshots and log chunks
+            │       ├── journal.ndjson     # State snapshots (with their duplets) and chunk summaries
             │       └── cache/             # Compressed log chunks
+            ├── sessions_index.json        # Cached list of all sessions' metadata
             └── exports/                   # Analysis results and visualizations
         """
-        self.snapshots = []
         self.log_directory = log_directory
-        self.last_snapshot_time = 0
-        self.snapshot_interval = 1.0  # 1 second between snapshots
+        # Interval bookkeeping uses time.monotonic_ns(). Entries are stamped with it
+        # too, and converted to wall-clock seconds on the writer thread by adding the
+        # offset between the two clocks taken here.
+        self._wall_clock_offset_ns = time.time_ns() - time.monotonic_ns()
+        self.last_snapshot_ns = 0
+        self._entries_since_snapshot = False  # Whether any flush was queued since then
+        self.snapshot_interval_ns = 1_000_000_000  # 1 second between snapshots
         self.log_lock = threading.Lock()
-        self.log_buffer = []  # Buffer for high-volume logs
-        self.buffer_flush_time = 0
-        self.buffer_flush_interval = 0.2  # Flush buffer every 200ms
         
-        # Session identification
-        self.session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        # Each producer thread appends to its own lock-free ring, so debug() never
+        # contends on a lock; flushes drain all registered rings
+        self._tls = threading.local()
+        self._thread_buffers = []
+        self.log_buffer_capacity = 8192  # Per-thread ring size (rounded up to a power of two)
+        self.dropped_count = 0  # Entries lost to buffer overflow this session
+        self._dropped_since_report = 0
+        self._last_drop_report_ns = 0
+        
+        # Flushed entries grouped by category for the next snapshot, as
+        # (timestamp, category, data, priority) rows. Only touched by the writer thread.
+        self._snapshot_by_cat = collections.defaultdict(list)
+        # Counts of rate-limited entries still to be summarized, guarded by log_lock
+        self._suppressed_pending = {}
+        
+        self.buffer_flush_interval_ns = 200_000_000  # Flusher thread period: every 200ms
+        self.buffer_flush_entries = 512  # ...or as soon as a buffer holds ~64 KiB of entries
+        self.bulk_log_samples = 3  # Entries sampled into a category's flush log line
+        
+        # Per-category token bucket that bounds the cost of runaway callers; high and
+        # critical entries are never rate-limited
+        self.category_rate_limit = 5000  # Sustained entries/sec per category and thread
+        self.category_burst = 5000  # Bucket size, i.e. entries allowed in a burst
+        
+        # Disk I/O (log flushes, snapshots) runs on a background writer thread so
+        # callers of debug() only pay for an append and, occasionally, an enqueue
+        self._io_queue = queue.Queue(maxsize=1024)
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="game-log-writer",
+                                               daemon=True)
+        # All flushes and snapshots run on a timer thread, so debug() never has to
+        # check the clock for them or drain buffers itself; size and priority
+        # triggers just wake the thread early
+        self._flusher_stop = threading.Event()
+        self._flush_requested = threading.Event()
+        self._flusher_thread = threading.Thread(target=self._flusher_loop, name="game-log-flusher",
+                                                daemon=True)
+        
+        # Session identification. The ID and the manifest's readable start time are
+        # both formatted from one reading of the clock.
         self.session_start_time = time.time()
-        
-        # In-memory cache of all logs for this session
-        self.log_cache = []
+        start = time.localtime(self.session_start_time)
+        self.session_id = f"session_{time.strftime('%Y%m%d_%H%M%S', start)}_{os.getpid()}"
+        self._session_start_readable = time.strftime("%Y-%m-%d %H:%M:%S", start)
+        self._latest_session_id = None  # Newest session on disk, set once it is known
+        
+        # In-memory cache of this session's logs not yet written to a chunk, stored
+        # column-wise: packed float timestamps plus parallel category, data and
+        # priority lists. Only touched by the writer thread (and finalize_cache).
+        self._cache_timestamps = array.array('d')
+        self._cache_categories = []
+        self._cache_datas = []
+        self._cache_priorities = []
         self.cache_size_limit = 10000  # Maximum number of entries before compressing to disk
+        self._last_chunk_file = None  # Most recent chunk, referenced by snapshot duplets
+        self._chunk_seq = 0  # Chunks written this session; keeps chunk names unique
+        self._duplet_count = 0
+        self._snapshot_count = 0  # Snapshots appended to the journal this session
+        self._last_snapshot_second = None  # strftime second of the last snapshot written
+        self._snapshot_suffix = 0
+        
+        # zstd settings for compressed log chunks (used when zstandard is installed)
+        self.zstd_level = 3
+        self.zstd_dict_size = 131072  # Target size of the trained dictionary in bytes
+        self.zstd_dict_min_samples = 1000  # Entries needed before training a dictionary
+        self.compression_min_bytes = 1024  # Smaller chunks are stored uncompressed
+        self.gzip_level = 1  # Fallback codec without zstandard; favors speed over ratio
+        self.csv_export_batch_rows = 65536  # Entries per DataFrame when exporting CSV
+        self.export_batch_entries = 1024  # Entries encoded and written together in other exports
+        self.export_buffer_size = 1 << 20  # Write buffer for export files, in bytes
+        self.export_zstd_level = 1  # Level for ".zst" exports, which are written in one pass
+        # Set when no exported value can contain commas, quotes or newlines, so CSV
+        # rows can be joined directly instead of going through a quoting writer
+        self.csv_no_quote = False
+        
+        # Legacy copies of snapshots/metadata under logs/ are opt-in; readers already
+        # prefer the per-session layout
+        self.legacy_compat = os.environ.get("ELEMENTAL_LEGACY_COMPAT", "0") == "1"
+        
+        # OPTIMIZE_LOGGING=true keeps the game log file to INFO and above, so routine
+        # entries only reach the log cache and snapshots
+        self.optimize_logging = os.environ.get("OPTIMIZE_LOGGING", "").lower() == "true"
+        self.file_log_level = "INFO" if self.optimize_logging else "DEBUG"
+        self.console_log_level = "INFO"
         
         # Create logs directory if it doesn't exist
-        if not os.path.exists(log_directory):
-            os.makedirs(log_directory)
+        os.makedirs(log_directory, exist_ok=True)
             
         # Create organized logs directory structure
         self._setup_log_directories()
@@ -110,13 +476,20 @@ class GameLogger:
         log_file = os.path.join(self.session_directory, f"game_log.log")
         self.log_file_path = log_file
         
+        # Sinks are enqueued so formatting and I/O happen on loguru's worker thread,
+        # never on the game thread
         logger.remove()  # Remove default handler
-        logger.add(log_file, rotation="100 MB", level="DEBUG", 
+        logger.add(log_file, rotation="100 MB", level=self.file_log_level, enqueue=True,
                   format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level} | {message}")
-        logger.add(lambda msg: print(msg), level="INFO", 
+        logger.add(sys.stderr, level=self.console_log_level, enqueue=True,
                   format="{time:HH:mm:ss} | {level} | {message}")
+        # Flush log lines are DEBUG records; skip building them when no sink takes those
+        self._flush_log_enabled = min(logger.level(self.file_log_level).no,
+                                      logger.level(self.console_log_level).no) <= logger.level("DEBUG").no
         
-        # Register cleanup handler
+        # Start the background writer and flusher and register cleanup handler
+        self._writer_thread.start()
+        self._flusher_thread.start()
         atexit.register(self.finalize_cache)
         
         # Create a session manifest file
@@ -131,9 +504,10 @@ class GameLogger:
         
         - sessions/: Container for all game sessions
           - session_YYYYMMDD_HHMMSS_PID/: Unique session directory
-            - snapshots/: Game state snapshots taken every second
+            - journal.ndjson: Append-only journal of the game state snapshots taken
+              every second, each embedding the duplet that pairs it with its log
+              chunk, and of log chunk summaries
             - cache/: Compressed log chunks for efficient storage
-            - duplets/: Paired snapshots and log chunks for analysis
         - exports/: Analysis results and visualizations
         
         Each session gets its own isolated directory for clear separation of data
@@ -142,6 +516,8 @@ class GameLogger:
         # Create main directories
         self.sessions_directory = os.path.join(self.log_directory, "sessions")
         os.makedirs(self.sessions_directory, exist_ok=True)
+        # Cached list of sessions' metadata, so listing sessions needn't open every file
+        self.sessions_index_path = os.path.join(self.log_directory, "sessions_index.json")
         
         # Ensure session_id always has the "session_" prefix for consistency
         if not self.session_id.startswith("session_"):
@@ -152,17 +528,26 @@ class GameLogger:
         os.makedirs(self.session_directory, exist_ok=True)
         
         # Create directories for different types of data
-        self.snapshots_directory = os.path.join(self.session_directory, "snapshots")
-        os.makedirs(self.snapshots_directory, exist_ok=True)
+        self.journal_path = os.path.join(self.session_directory, JOURNAL_FILENAME)
+        self._journal = None  # Opened by the writer thread on first use
         
         self.cache_directory = os.path.join(self.session_directory, "cache")
         os.makedirs(self.cache_directory, exist_ok=True)
         
-        self.duplets_directory = os.path.join(self.session_directory, "duplets")
-        os.makedirs(self.duplets_directory, exist_ok=True)
-        
+        # Created once here, so exports can use it without checking again
         self.exports_directory = os.path.join(self.log_directory, "exports")
         os.makedirs(self.exports_directory, exist_ok=True)
+        
+        # Shared zstd dictionary trained on earlier chunks; each session keeps a copy
+        # of the dictionary its chunks were written with so they stay readable.
+        self.zstd_dict_path = os.path.join(self.log_directory, "cache", "log_chunks.zdict")
+        self.session_zstd_dict_path = os.path.join(self.cache_directory, "log_chunks.zdict")
+        self._zstd_dict = self._load_zstd_dict(self.zstd_dict_path)
+        self._session_zstd_dict_saved = False
+        # Set when training fails, so later chunks use plain zstd instead of retrying
+        self._zstd_dict_training_failed = False
+        # Chunk compressor, reused across chunks until the dictionary changes
+        self._zstd_compressor = None
 
     def _create_session_manifest(self):
         """Create a manifest file for the current session with metadata."""
@@ -171,15 +556,14 @@ class GameLogger:
         manifest = {
             "session_id": self.session_id,
             "start_time": self.session_start_time,
-            "python_version": sys.version,
-            "platform": sys.platform,
-            "executable": sys.executable,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "game_version": "0.1.0",  # Should be pulled from game config
+            "timestamp": self._session_start_readable,
+            **_STATIC_MANIFEST,
         }
         
-        with open(manifest_file, "w") as f:
-            json.dump(manifest, f, indent=2, cls=CustomJSONEncoder)
+        _write_atomic(manifest_file, _json_bytes(manifest, indent=True))
+        
+        # This session is now the newest one on disk
+        self._latest_session_id = self.session_id
 
     def debug(self, category, data, priority="normal"):
         """
@@ -194,37 +578,77 @@ class GameLogger:
             data (dict): The data to log, should be serializable to JSON
             priority (str): Priority level ("low", "normal", "high", "critical")
         """
-        timestamp = time.time()
-        
-        # Create structured log entry
-        log_entry = {
-            "timestamp": timestamp,
-            "category": category,
-            "data": data,
-            "priority": priority,
-            "session_id": self.session_id
-        }
-        
-        # Add to in-memory cache
-        with self.log_lock:
-            self.log_buffer.append(log_entry)
-            
-            # Flush buffer if interval elapsed or high priority
-            current_time = time.time()
-            if (current_time - self.buffer_flush_time >= self.buffer_flush_interval or 
-                priority in ["high", "critical"]):
-                self._flush_log_buffer()
-                
-        # Also send to loguru for console output and file rotation
-        if priority == "high" or priority == "critical":
-            logger.warning(f"{category}: {json.dumps(data, cls=CustomJSONEncoder)}")
+        now_ns = time.monotonic_ns()  # The only clock read per entry
+        high_priority = priority in _HIGH_PRIORITIES
+        try:
+            buf = self._tls.buf
+        except AttributeError:
+            buf = self._register_thread_buffer()
+        
+        # Refill this category's token bucket; over the limit, only count the entry.
+        # Attributes read more than once are loaded into locals first.
+        if not high_priority:
+            bucket = buf.rate_buckets.get(category)
+            if bucket is None:
+                bucket = buf.rate_buckets[category] = [self.category_burst, now_ns, 0]
+            else:
+                tokens = bucket[0] + (now_ns - bucket[1]) * self.category_rate_limit * 1e-9
+                burst = self.category_burst
+                bucket[0] = tokens if tokens < burst else burst
+                bucket[1] = now_ns
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return
+            bucket[0] -= 1
+        
+        # Add to this thread's ring unless it is full; only this thread moves tail
+        tail = buf.tail
+        buffered = tail - buf.head
+        mask = buf.mask
+        if buffered <= mask:
+            # Store the entry's fields in the column rings; the writer thread builds the
+            # structured entry. The session ID is not stored per entry: every chunk
+            # belongs to one session, so it is recorded in the chunk summary and
+            # reattached on load.
+            slot = tail & mask
+            buf.timestamps[slot] = now_ns
+            buf.categories[slot] = category
+            buf.datas[slot] = data
+            buf.priorities[slot] = priority
+            buf.tail = tail + 1  # Publish the slot only once it is filled
+            buffered += 1
         else:
-            logger.debug(f"{category}: {json.dumps(data, cls=CustomJSONEncoder)}")
+            buf.dropped += 1  # Full until the next flush drains it
             
-        # Take a snapshot if it's time
-        if timestamp - self.last_snapshot_time >= self.snapshot_interval:
-            self.create_snapshot()
+        # Wake the flusher early if this buffer is large or the entry is high
+        # priority; otherwise it flushes on its own timer. A ring that still fills
+        # past half (a producer outrunning the flusher) is drained here instead, so
+        # entries aren't dropped while waiting for the flusher to be scheduled. That
+        # drain never waits: if another flush holds the lock, the flusher is woken.
+        if buffered >= self.buffer_flush_entries or high_priority:
+            if buffered > mask >> 1:
+                self._flush_log_buffer(now_ns, block=False)
+            else:
+                flush_requested = self._flush_requested
+                if not flush_requested.is_set():
+                    flush_requested.set()
+                
+        # Surface important entries through loguru right away. Routine entries reach
+        # the log file in bulk from _flush_log_buffer, so they aren't serialized here.
+        # The lazy callable means the JSON is only built if a sink accepts the record.
+        if high_priority:
+            _lazy_logger.warning(
+                "{}", lambda: f"{category}: {_json_bytes(data).decode()}")
             
+    def _register_thread_buffer(self):
+        """Create the calling thread's log buffer and register it for flushing."""
+        capacity = 1 << max(self.log_buffer_capacity - 1, 1).bit_length()
+        buf = _ThreadLogBuffer(capacity)
+        self._tls.buf = buf
+        with self.log_lock:
+            self._thread_buffers.append(buf)
+        return buf
+    
     def get_current_session_id(self):
         """Get the current session ID.
         
@@ -233,55 +657,231 @@ class GameLogger:
         """
         return self.session_id
     
+    def get_latest_session_id(self):
+        """Get the ID of the most recent session.
+        
+        This is the session this logger started, once its manifest exists; otherwise
+        the cached sessions are scanned.
+        
+        Returns:
+            str: The most recent session ID, or None if there are no sessions
+        """
+        latest = self._latest_session_id
+        if latest is None:
+            sessions = self.get_cached_sessions()
+            if sessions:
+                latest = self._latest_session_id = sessions[-1]['session_id']
+        return latest
+    
+    def _flusher_loop(self):
+        """Flush the thread buffers every buffer_flush_interval_ns or when woken, and take snapshots, until stopped."""
+        stop = self._flusher_stop
+        flush_requested = self._flush_requested
+        while True:
+            flush_requested.wait(self.buffer_flush_interval_ns / 1e9)
+            if stop.is_set():
+                return
+            # Cleared before flushing, so requests made during the flush wake it again
+            flush_requested.clear()
+            try:
+                now_ns = time.monotonic_ns()
+                if now_ns - self.last_snapshot_ns >= self.snapshot_interval_ns:
+                    self.create_snapshot()  # Flushes as well
+                else:
+                    self._flush_log_buffer(now_ns)
+            except Exception as e:
+                logger.error(f"Background log flusher error: {e}")
+    
+    def _writer_loop(self):
+        """Run queued disk I/O jobs on the background writer thread until a stop sentinel arrives.
+        
+        Flushes that queued up while the writer was busy are coalesced into a single
+        _write_log_entries call, so bursts cost one bulk write instead of one per flush.
+        Any other job ends the run and executes after it, preserving queue order. A run
+        also ends once it holds cache_size_limit entries, so the log cache is compressed
+        to disk before a backlog can grow it far past that bound.
+        """
+        io_queue = self._io_queue
+        write_entries = self._write_log_entries
+        no_job = object()  # Distinct from the None stop sentinel
+        pending = no_job
+        while True:
+            job = io_queue.get() if pending is no_job else pending
+            pending = no_job
+            taken = 1
+            try:
+                if job is None:
+                    return
+                
+                action, args = job
+                if action == write_entries:
+                    drained_buffers = list(args[0])
+                    queued = sum(len(columns[0]) for columns in drained_buffers)
+                    while queued < self.cache_size_limit:
+                        try:
+                            next_job = io_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if next_job is None or next_job[0] != write_entries:
+                            pending = next_job
+                            break
+                        drained_buffers.extend(next_job[1][0])
+                        queued += sum(len(columns[0]) for columns in next_job[1][0])
+                        taken += 1
+                    args = (drained_buffers,)
+                action(*args)
+            except Exception as e:
+                logger.error(f"Background log writer error: {e}")
+            finally:
+                for _ in range(taken):
+                    io_queue.task_done()
+    
+    def _load_zstd_dict(self, dict_path):
+        """Load a zstd compression dictionary from disk, if available."""
+        if zstd is None or not os.path.exists(dict_path):
+            return None
+        try:
+            with open(dict_path, 'rb') as f:
+                return zstd.ZstdCompressionDict(f.read())
+        except Exception as e:
+            logger.error(f"Failed to load zstd dictionary {dict_path}: {e}")
+            return None
+    
+    def _train_zstd_dict(self, samples):
+        """Train a zstd dictionary on individual log entries' packed data and persist it for later sessions.
+        
+        Entry data shares a small, highly repetitive schema, which is where a trained
+        dictionary pays off compared to compressing each chunk from scratch.
+        """
+        try:
+            zstd_dict = zstd.train_dictionary(self.zstd_dict_size, samples)
+            os.makedirs(os.path.dirname(self.zstd_dict_path), exist_ok=True)
+            # Other sessions load this dictionary at startup
+            _write_atomic(self.zstd_dict_path, zstd_dict.as_bytes())
+            logger.debug("Trained zstd dictionary on {} log entries", len(samples))
+            return zstd_dict
+        except Exception as e:
+            logger.error(f"Failed to train zstd dictionary: {e}")
+            return None
+    
     def compress_cache_chunk(self):
-        """Compress and store a chunk of the log cache to disk in a lightweight format."""
-        if not self.log_cache:
+        """Compress and store a chunk of the log cache to disk in a lightweight format.
+        
+        Chunks are zstd-compressed (with a trained dictionary once one exists) when the
+        zstandard package is installed, and gzip-compressed otherwise. Chunks whose
+        serialized size is below compression_min_bytes are stored uncompressed,
+        since compressing such small payloads costs CPU for little or negative gain.
+        
+        The payload is columnar: a map of the timestamp (packed little-endian
+        doubles), category and priority columns, followed by the data column last so
+        readers can stream entries' data one at a time.
+        """
+        timestamps = self._cache_timestamps
+        if not timestamps:
             return
+        
+        # Each writer job is merged into time order, but two jobs can overlap by a few
+        # entries. Sort the chunk once here if needed, so readers never have to.
+        if any(map(operator.gt, timestamps, itertools.islice(timestamps, 1, None))):
+            order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+            self._cache_timestamps = timestamps = array.array('d', map(timestamps.__getitem__, order))
+            self._cache_categories = list(map(self._cache_categories.__getitem__, order))
+            self._cache_datas = list(map(self._cache_datas.__getitem__, order))
+            self._cache_priorities = list(map(self._cache_priorities.__getitem__, order))
+        datas = self._cache_datas
             
-        chunk_id = int(time.time())
-        chunk_file = os.path.join(self.cache_directory, f"{chunk_id}.cache")
+        chunk_id = int(time.time() * 1000)
+        chunk_file = None
         
         try:
-            # Serialize and compress
-            with gzip.open(chunk_file, 'wb') as f:
-                pickle.dump(self.log_cache, f)
+            # Serialize, then pick a compression scheme based on the payload size
+            columns = {
+                "timestamp": _timestamps_to_bytes(timestamps),
+                "category": self._cache_categories,
+                "priority": self._cache_priorities,
+            }
+            dict_samples = None
+            if (zstd is not None and self._zstd_dict is None
+                    and not self._zstd_dict_training_failed
+                    and len(datas) >= self.zstd_dict_min_samples):
+                # A dictionary is about to be trained on each entry's packed data; the
+                # payload's data column reuses those bytes instead of packing them again
+                dict_samples = [_pack_chunk(data) for data in datas]
+            if dict_samples is not None and msgpack is not None:
+                payload = _pack_chunk_columns(columns, dict_samples)
+            else:
+                columns["data"] = datas
+                payload = _pack_chunk(columns)
+            if len(payload) < self.compression_min_bytes:
+                compression = "none"
+            else:
+                compression = "zstd" if zstd is not None else "gzip"
+            # Chunks can be written within the same millisecond (e.g. the last one at
+            # finalize_cache), so the name also carries a sequence number. It is
+            # zero-padded so names still sort in write order.
+            chunk_file = os.path.join(self.cache_directory,
+                                      f"chunk_{chunk_id}_{self._chunk_seq:06d}{CHUNK_EXTENSIONS[compression]}")
+            self._chunk_seq += 1
+            
+            if compression == "zstd":
+                if dict_samples is not None:
+                    self._zstd_dict = self._train_zstd_dict(dict_samples)
+                    self._zstd_dict_training_failed = self._zstd_dict is None
+                    self._zstd_compressor = None
+                if self._zstd_dict is not None and not self._session_zstd_dict_saved:
+                    with open(self.session_zstd_dict_path, 'wb') as f:
+                        f.write(self._zstd_dict.as_bytes())
+                    self._session_zstd_dict_saved = True
                 
-            # Create a summary file for easy browsing
-            summary_file = os.path.join(self.cache_directory, f"{chunk_id}_summary.json")
-            
-            # Generate summary statistics
-            categories = {}
-            for entry in self.log_cache:
-                cat = entry.get('category', 'unknown')
-                if cat not in categories:
-                    categories[cat] = 0
-                categories[cat] += 1
+                cctx = self._zstd_compressor
+                if cctx is None:
+                    cctx = self._zstd_compressor = zstd.ZstdCompressor(level=self.zstd_level,
+                                                                        dict_data=self._zstd_dict)
+                with open(chunk_file, 'wb') as f:
+                    f.write(cctx.compress(payload))
+            elif compression == "gzip":
+                # Compress the whole payload in one call rather than through a GzipFile
+                with open(chunk_file, 'wb') as f:
+                    f.write(gzip.compress(payload, compresslevel=self.gzip_level))
+            else:
+                with open(chunk_file, 'wb') as f:
+                    f.write(payload)
+                
+            # Record a summary in the session journal for easy browsing
+            categories = dict(collections.Counter(self._cache_categories))
                 
             summary = {
+                "kind": "chunk",
                 "chunk_id": chunk_id,
-                "entries": len(self.log_cache),
-                "start_time": self.log_cache[0]['timestamp'] if self.log_cache else time.time(),
-                "end_time": self.log_cache[-1]['timestamp'] if self.log_cache else time.time(),
+                "chunk_file": chunk_file,
+                "session_id": self.session_id,
+                "compression": compression,
+                "entries": len(timestamps),
+                "start_time": timestamps[0],
+                "end_time": timestamps[-1],
                 "categories": categories
             }
             
-            # Make sure the summary file also gets properly written and closed
             try:
-                with open(summary_file, 'w') as f:
-                    json.dump(summary, f, indent=2, cls=CustomJSONEncoder)
+                self._append_journal(_json_bytes(summary))
             except Exception as e:
-                logger.error(f"Failed to write summary file: {e}")
+                logger.error(f"Failed to write chunk summary: {e}")
                 
             # Only clear the cache if everything succeeded
-            self.log_cache = []
+            self._cache_timestamps = array.array('d')
+            self._cache_categories = []
+            self._cache_datas = []
+            self._cache_priorities = []
+            self._last_chunk_file = chunk_file
             
-            logger.debug(f"Compressed log cache to {chunk_file} ({len(categories)} categories, {summary['entries']} entries)")
+            logger.debug("Compressed log cache to {} ({} categories, {} entries)",
+                         chunk_file, len(categories), summary['entries'])
             return chunk_file
             
         except Exception as e:
             logger.error(f"Failed to compress log cache: {e}")
             # Attempt to remove potentially corrupt file
-            if os.path.exists(chunk_file):
+            if chunk_file and os.path.exists(chunk_file):
                 try:
                     os.remove(chunk_file)
                 except Exception:
@@ -290,9 +890,26 @@ class GameLogger:
     
     def finalize_cache(self):
         """Finalize the log cache when the game terminates."""
+        # Stop periodic flushes, hand any buffered entries to the writer, then let it
+        # drain and stop
+        self._flusher_stop.set()
+        self._flush_requested.set()
+        if self._flusher_thread.is_alive() and self._flusher_thread is not threading.current_thread():
+            self._flusher_thread.join()
+        if self._writer_thread.is_alive():
+            self._flush_log_buffer()
+            self._io_queue.put(None)
+            self._writer_thread.join()
+        
         # Compress any remaining logs in the cache
-        if self.log_cache:
+        if self._cache_timestamps:
             self.compress_cache_chunk()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        
+        # Check the session index before this session's files change the directories
+        sessions_index = self._load_sessions_index()
             
         # Create a metadata file for this session
         session_metadata = {
@@ -302,184 +919,329 @@ class GameLogger:
             "duration": time.time() - self.session_start_time,
             "log_file": self.log_file_path,
             "snapshot_count": self._count_snapshots(),
-            "duplet_count": self._count_duplets()
+            "duplet_count": self._count_duplets(),
+            "dropped_log_entries": self.dropped_count
         }
         
         metadata_file = os.path.join(self.session_directory, "metadata.json")
         try:
-            with open(metadata_file, 'w') as f:
-                json.dump(session_metadata, f, indent=2, cls=CustomJSONEncoder)
+            payload = _json_bytes(session_metadata, indent=True)
+            _write_atomic(metadata_file, payload)
                 
-            # Create a symlink in the main cache directory for backward compatibility
-            compat_metadata_file = os.path.join(self.log_directory, "cache", f"{self.session_id}_metadata.json")
-            with open(compat_metadata_file, 'w') as f:
-                json.dump(session_metadata, f, indent=2, cls=CustomJSONEncoder)
+            # Link into the main cache directory for backward compatibility
+            if self.legacy_compat:
+                os.makedirs(os.path.join(self.log_directory, "cache"), exist_ok=True)
+                compat_metadata_file = os.path.join(self.log_directory, "cache", f"{self.session_id}_metadata.json")
+                self._link_compat_file(metadata_file, compat_metadata_file, payload)
+            
+            # Keep an up-to-date index current with this session's final metadata
+            if sessions_index is not None:
+                sessions_index = [s for s in sessions_index if s.get("session_id") != self.session_id]
+                sessions_index.append(session_metadata)
+                sessions_index.sort(key=lambda x: x.get("start_time", 0))
+                self._save_sessions_index(sessions_index)
         except Exception as e:
             logger.error(f"Error writing session metadata: {str(e)}")
             
         logger.debug(f"Session {self.session_id} cache finalized")
         
     def _count_snapshots(self):
-        """Count the number of snapshot files for this session."""
-        try:
-            return len([f for f in os.listdir(self.snapshots_directory) if f.endswith('.json')])
-        except:
-            return 0
+        """Count the snapshots written to this session's journal, as tallied in memory."""
+        return self._snapshot_count
             
     def _count_duplets(self):
-        """Count the number of duplet files for this session."""
-        try:
-            return len([f for f in os.listdir(self.duplets_directory) if f.endswith('.json')])
-        except:
-            return 0
+        """Count the number of duplets written for this session."""
+        return self._duplet_count
+        
+    def _load_sessions_index(self):
+        """Load the cached session list, or None if it is missing or out of date.
         
+        The index is current as long as it is newer than both directories it covers
+        and every session's metadata.json: adding or removing a session (or a legacy
+        metadata file) updates the directory's mtime, but rewriting a session's
+        metadata only changes that file's.
+        """
+        try:
+            index_mtime = os.stat(self.sessions_index_path).st_mtime_ns
+            for directory in (self.sessions_directory, os.path.join(self.log_directory, "cache")):
+                try:
+                    if os.stat(directory).st_mtime_ns > index_mtime:
+                        return None
+                except FileNotFoundError:
+                    pass
+            with os.scandir(self.sessions_directory) as it:
+                session_paths = [entry.path for entry in it if entry.is_dir()]
+            for session_path in session_paths:
+                try:
+                    if os.stat(os.path.join(session_path, "metadata.json")).st_mtime_ns > index_mtime:
+                        return None
+                except FileNotFoundError:
+                    pass
+            with open(self.sessions_index_path, 'rb') as f:
+                sessions = _json_loads(f.read())
+            return sessions if isinstance(sessions, list) else None
+        except (OSError, ValueError):
+            return None
+    
+    def _save_sessions_index(self, sessions):
+        """Write the session list index, replacing the old one atomically."""
+        try:
+            _write_atomic(self.sessions_index_path, _json_bytes(sessions))
+        except OSError as e:
+            logger.error(f"Error writing sessions index: {e}")
+    
     def get_cached_sessions(self):
-        """Get a list of all cached sessions."""
+        """Get a list of all cached sessions.
+        
+        Served from logs/sessions_index.json while it is current; otherwise the
+        session directories are scanned and the index is rebuilt.
+        """
+        sessions = self._load_sessions_index()
+        if sessions is not None:
+            return sessions
         sessions = []
         
         # Look for session directories
         if os.path.exists(self.sessions_directory):
-            for session_dir in os.listdir(self.sessions_directory):
-                session_path = os.path.join(self.sessions_directory, session_dir)
-                if os.path.isdir(session_path):
-                    metadata_path = os.path.join(session_path, "metadata.json")
-                    manifest_path = os.path.join(session_path, "manifest.json")
-                    
-                    # Try to load metadata, or manifest if metadata doesn't exist
+            with os.scandir(self.sessions_directory) as it:
+                session_paths = [entry.path for entry in it if entry.is_dir()]
+            for session_path in session_paths:
+                metadata_path = os.path.join(session_path, "metadata.json")
+                manifest_path = os.path.join(session_path, "manifest.json")
+                
+                # Try to load metadata, or manifest if metadata doesn't exist. Opening
+                # directly saves an exists() check per file.
+                try:
                     try:
-                        if os.path.exists(metadata_path):
-                            with open(metadata_path, 'r') as f:
-                                metadata = json.load(f)
-                                sessions.append(metadata)
-                        elif os.path.exists(manifest_path):
-                            with open(manifest_path, 'r') as f:
-                                manifest = json.load(f)
-                                sessions.append(manifest)
-                    except:
-                        pass
+                        with open(metadata_path, 'rb') as f:
+                            metadata = _json_loads(f.read())
+                            sessions.append(metadata)
+                    except FileNotFoundError:
+                        with open(manifest_path, 'rb') as f:
+                            manifest = _json_loads(f.read())
+                            sessions.append(manifest)
+                except:
+                    pass
         
         # For backward compatibility, also check the cache directory
         if os.path.exists(os.path.join(self.log_directory, "cache")):
-            for filename in os.listdir(os.path.join(self.log_directory, "cache")):
-                if filename.endswith("_metadata.json"):
-                    session_id = filename.replace("_metadata.json", "")
-                    
-                    # Skip if we already found this session
-                    if any(s.get("session_id") == session_id for s in sessions):
-                        continue
-                        
-                    try:
-                        with open(os.path.join(self.log_directory, "cache", filename), 'r') as f:
-                            metadata = json.load(f)
-                            sessions.append(metadata)
-                    except:
-                        pass
+            known_sessions = {s.get("session_id") for s in sessions}
+            with os.scandir(os.path.join(self.log_directory, "cache")) as it:
+                metadata_entries = [entry for entry in it if entry.name.endswith("_metadata.json")]
+            for dir_entry in metadata_entries:
+                session_id = dir_entry.name.replace("_metadata.json", "")
+
+                # Skip if we already found this session
+                if session_id in known_sessions:
+                    continue
+
+                try:
+                    with open(dir_entry.path, 'rb') as f:
+                        metadata = _json_loads(f.read())
+                        sessions.append(metadata)
+                except:
+                    pass
         
         # Sort by start time
         sessions.sort(key=lambda x: x.get("start_time", 0))
+        self._save_sessions_index(sessions)
         return sessions
     
-    def load_session_logs(self, session_id):
-        """Load all logs for a given session."""
-        logs = []
+    def _open_cache_chunk(self, file_path, zstd_dict=None):
+        """Open a log chunk as a buffered stream of its decompressed payload."""
+        if file_path.endswith(".bin"):
+            return open(file_path, 'rb')
+        
+        if file_path.endswith(".zst"):
+            if zstd is None:
+                raise RuntimeError("the zstandard package is required to read .zst log chunks")
+            reader = zstd.ZstdDecompressor(dict_data=zstd_dict).stream_reader(open(file_path, 'rb'),
+                                                                              closefd=True)
+            return io.BufferedReader(reader)
+        
+        return gzip.open(file_path, 'rb')
+    
+    def _iter_cache_chunk(self, file_path, session_id, zstd_dict=None):
+        """Yield the entries of one log chunk, decoding them one at a time.
+        
+        Columnar msgpack chunks load their small timestamp, category and priority
+        columns up front and then stream the data column, so only one entry's data is
+        decoded at a time; older msgpack chunks (a list of entry maps) are streamed
+        entry by entry. Pickled chunks have to be loaded whole. Pickle protocol 2+
+        streams always start with the PROTO opcode (0x80), which msgpack never emits
+        for a non-empty map or a list, so the formats are told apart by peeking at the
+        first byte. Errors are logged and end the chunk.
+        """
+        filename = os.path.basename(file_path)
+        count = 0
+        try:
+            with self._open_cache_chunk(file_path, zstd_dict) as f:
+                first_byte = f.peek(1)[:1]
+                if first_byte == b"\x80":
+                    chunk_logs = pickle.load(f)
+                    if isinstance(chunk_logs, dict):
+                        entries = _iter_chunk_columns(chunk_logs, chunk_logs["data"])
+                    elif isinstance(chunk_logs, list):
+                        entries = iter(chunk_logs)
+                    else:
+                        logger.warning(f"Log chunk {filename} has unexpected format, skipping")
+                        return
+                else:
+                    if msgpack is None:
+                        raise RuntimeError("the msgpack package is required to read msgpack log chunks")
+                    unpacker = msgpack.Unpacker(f, raw=False, strict_map_key=False)
+                    if first_byte and first_byte[0] in _MSGPACK_MAP_MARKERS:
+                        # Columnar chunk: every column but data precedes it
+                        columns = {}
+                        for _ in range(unpacker.read_map_header()):
+                            key = unpacker.unpack()
+                            if key == "data":
+                                break
+                            columns[key] = unpacker.unpack()
+                        length = unpacker.read_array_header()
+                        datas = (unpacker.unpack() for _ in range(length))
+                        entries = _iter_chunk_columns(columns, datas)
+                    else:
+                        try:
+                            length = unpacker.read_array_header()
+                        except ValueError:  # Top-level object is not a list
+                            logger.warning(f"Log chunk {filename} has unexpected format, skipping")
+                            return
+                        entries = (unpacker.unpack() for _ in range(length))
+                
+                for entry in entries:
+                    # Entries are stored without their session ID; reattach it for callers
+                    if "session_id" not in entry:
+                        entry["session_id"] = session_id
+                    count += 1
+                    yield entry
+            logger.debug("Successfully loaded {} log entries from {}", count, filename)
+        except _CHUNK_EOF_ERRORS:
+            logger.error(f"Incomplete envelope: unexpected EOF in {filename} - file is corrupted")
+        except Exception as e:
+            logger.error(f"Error loading log chunk {filename}: {str(e)}")
+    
+    def _session_chunk_files(self, session_id):
+        """List a session's log chunk files in order, with the zstd dictionary they need."""
+        # First try the new directory structure
+        cache_dir = os.path.join(self.sessions_directory, session_id, "cache")
+        if os.path.exists(cache_dir):
+            with os.scandir(cache_dir) as it:
+                chunk_entries = sorted((entry for entry in it
+                                        if entry.name.startswith("chunk_") and entry.name.endswith(CHUNK_SUFFIXES)),
+                                       key=lambda entry: entry.name)
+            if chunk_entries:
+                # Chunks written with a trained zstd dictionary need that same dictionary
+                zstd_dict = self._load_zstd_dict(os.path.join(cache_dir, "log_chunks.zdict"))
+                return chunk_entries, zstd_dict
+        
+        # For backward compatibility, fall back to the old location
+        legacy_cache_dir = os.path.join(self.log_directory, "cache")
+        if os.path.exists(legacy_cache_dir):
+            with os.scandir(legacy_cache_dir) as it:
+                chunk_entries = sorted((entry for entry in it
+                                        if entry.name.startswith(f"{session_id}_chunk_") and entry.name.endswith(".gz")),
+                                       key=lambda entry: entry.name)
+            return chunk_entries, None
+        return [], None
+    
+    def iter_session_logs(self, session_id):
+        """Iterate over all logs for a given session in timestamp order.
         
-        # First try to load from new directory structure
-        session_dir = os.path.join(self.sessions_directory, session_id)
-        cache_dir = os.path.join(session_dir, "cache")
+        Chunks are decoded lazily and merged, so memory stays proportional to the
+        number of chunks rather than the number of entries, and callers can stop early.
         
-        if os.path.exists(cache_dir):
-            # Find all chunk files for this session in the new location
-            for filename in sorted(os.listdir(cache_dir)):
-                if filename.startswith("chunk_") and filename.endswith(".gz"):
-                    file_path = os.path.join(cache_dir, filename)
-                    try:
-                        # First check if file might be corrupted (too small to be valid)
-                        file_size = os.path.getsize(file_path)
-                        if file_size < 10:  # Extremely small files are likely corrupted
-                            logger.warning(f"Skipping suspiciously small log chunk: {filename} ({file_size} bytes)")
-                            continue
-                            
-                        with gzip.open(file_path, 'rb') as f:
-                            chunk_logs = pickle.load(f)
-                            if not isinstance(chunk_logs, list):
-                                logger.warning(f"Log chunk {filename} has unexpected format, skipping")
-                                continue
-                            logs.extend(chunk_logs)
-                            logger.debug(f"Successfully loaded {len(chunk_logs)} log entries from {filename}")
-                    except EOFError:
-                        logger.error(f"Incomplete envelope: unexpected EOF in {filename} - file is corrupted")
-                        continue
-                    except Exception as e:
-                        logger.error(f"Error loading log chunk {filename}: {str(e)}")
-                        continue
-        
-        # For backward compatibility, also check the old location
-        if not logs and os.path.exists(os.path.join(self.log_directory, "cache")):
-            for filename in sorted(os.listdir(os.path.join(self.log_directory, "cache"))):
-                if filename.startswith(f"{session_id}_chunk_") and filename.endswith(".gz"):
-                    file_path = os.path.join(self.log_directory, "cache", filename)
-                    try:
-                        # First check if file might be corrupted (too small to be valid)
-                        file_size = os.path.getsize(file_path)
-                        if file_size < 10:  # Extremely small files are likely corrupted
-                            logger.warning(f"Skipping suspiciously small log chunk: {filename} ({file_size} bytes)")
-                            continue
-                            
-                        with gzip.open(file_path, 'rb') as f:
-                            chunk_logs = pickle.load(f)
-                            if not isinstance(chunk_logs, list):
-                                logger.warning(f"Log chunk {filename} has unexpected format, skipping")
-                                continue
-                            logs.extend(chunk_logs)
-                            logger.debug(f"Successfully loaded {len(chunk_logs)} log entries from {filename}")
-                    except EOFError:
-                        logger.error(f"Incomplete envelope: unexpected EOF in {filename} - file is corrupted")
-                        continue
-                    except Exception as e:
-                        logger.error(f"Error loading log chunk {filename}: {str(e)}")
-                        continue
-                        
-        # Sort logs by timestamp
-        logs.sort(key=lambda x: x.get("timestamp", 0))
-        return logs
+        Args:
+            session_id (str): The session to read
+            
+        Returns:
+            iterator: Log entry dicts, oldest first
+        """
+        chunk_entries, zstd_dict = self._session_chunk_files(session_id)
+        
+        chunk_iters = []
+        for dir_entry in chunk_entries:
+            # First check if file might be corrupted (too small to be valid)
+            file_size = dir_entry.stat().st_size
+            if file_size < 10:  # Extremely small files are likely corrupted
+                logger.warning(f"Skipping suspiciously small log chunk: {dir_entry.name} ({file_size} bytes)")
+                continue
+            chunk_iters.append(self._iter_cache_chunk(dir_entry.path, session_id, zstd_dict))
+        
+        # Each chunk is sorted on write, so a K-way merge restores global order
+        return heapq.merge(*chunk_iters, key=lambda x: x.get("timestamp", 0))
+    
+    def load_session_logs(self, session_id):
+        """Load all logs for a given session.
+        
+        Chunks are sorted when written and merged by iter_session_logs, so the
+        entries come back in timestamp order without sorting them again here.
+        """
+        return list(self.iter_session_logs(session_id))
         
     def get_session_snapshots(self, session_id):
-        """Get all snapshots for a specific session."""
+        """Get all snapshots for a specific session.
+        
+        Snapshots are read from the session journal; sessions recorded before that
+        have them as separate files in a snapshots/ directory, which are read first.
+        """
         snapshots = []
         
-        # Look in the session's snapshot directory
+        # Look in the session's legacy snapshot directory
         session_dir = os.path.join(self.sessions_directory, session_id)
         snapshots_dir = os.path.join(session_dir, "snapshots")
         
         if os.path.exists(snapshots_dir):
-            for filename in sorted(os.listdir(snapshots_dir)):
-                if filename.startswith("snapshot_") and filename.endswith(".json"):
-                    try:
-                        with open(os.path.join(snapshots_dir, filename), 'r') as f:
-                            snapshot = json.load(f)
-                            snapshots.append(snapshot)
-                    except Exception as e:
-                        logger.error(f"Error loading snapshot {filename}: {str(e)}")
+            with os.scandir(snapshots_dir) as it:
+                snapshot_entries = sorted((entry for entry in it
+                                           if entry.name.startswith("snapshot_") and entry.name.endswith(".json")),
+                                          key=lambda entry: entry.name)
+            for dir_entry in snapshot_entries:
+                filename = dir_entry.name
+                try:
+                    with open(dir_entry.path, 'rb') as f:
+                        snapshot = _json_loads(f.read())
+                        snapshots.append(snapshot)
+                except Exception as e:
+                    logger.error(f"Error loading snapshot {filename}: {str(e)}")
         
+        snapshots.extend(read_session_journal(session_dir, "snapshot"))
         return snapshots
         
     def get_session_duplets(self, session_id):
-        """Get all duplets for a specific session."""
+        """Get all duplets for a specific session.
+        
+        Duplets are embedded in their snapshots; sessions recorded before that have
+        them as separate files in a duplets/ directory, which are read as well.
+        """
         duplets = []
         
-        # Look in the session's duplet directory
+        # Look in the session's legacy duplet directory
         session_dir = os.path.join(self.sessions_directory, session_id)
         duplets_dir = os.path.join(session_dir, "duplets")
         
         if os.path.exists(duplets_dir):
-            for filename in sorted(os.listdir(duplets_dir)):
-                if filename.startswith("duplet_") and filename.endswith(".json"):
-                    try:
-                        with open(os.path.join(duplets_dir, filename), 'r') as f:
-                            duplet = json.load(f)
-                            duplets.append(duplet)
-                    except Exception as e:
-                        logger.error(f"Error loading duplet {filename}: {str(e)}")
+            with os.scandir(duplets_dir) as it:
+                duplet_entries = sorted((entry for entry in it
+                                         if entry.name.startswith("duplet_") and entry.name.endswith(".json")),
+                                        key=lambda entry: entry.name)
+            for dir_entry in duplet_entries:
+                filename = dir_entry.name
+                try:
+                    with open(dir_entry.path, 'rb') as f:
+                        duplet = _json_loads(f.read())
+                        duplets.append(duplet)
+                except Exception as e:
+                    logger.error(f"Error loading duplet {filename}: {str(e)}")
+        
+        for snapshot in self.get_session_snapshots(session_id):
+            if "duplet" in snapshot:
+                # Embedded duplets take the fields they share with their snapshot from it
+                duplet = snapshot["duplet"]
+                for key in _DUPLET_SHARED_FIELDS:
+                    if key not in duplet and key in snapshot:
+                        duplet[key] = snapshot[key]
+                duplets.append(duplet)
         
         return duplets
 
@@ -495,87 +1257,138 @@ class GameLogger:
         3. Session correlation for gameplay pattern identification
         4. Duplet creation that links logs with corresponding game states
         
-        Snapshots are stored in two locations:
-        - session_id/snapshots/ - Primary location for the current session
-        - logs/ - Legacy location for backward compatibility
+        Snapshots are appended to session_id/journal.ndjson, so taking one creates no
+        new file. When ELEMENTAL_LEGACY_COMPAT=1 is set, each one is also written to
+        logs/ as its own file for backward compatibility.
         
-        Each snapshot generates a corresponding duplet that pairs it with relevant logs
+        Each snapshot embeds a corresponding duplet that pairs it with relevant logs
         for comprehensive context during analysis.
         
+        The writer thread groups entries by category as it processes each flush, so
+        taking a snapshot only queues a job that swaps out those groups and writes
+        them. Runs of rate-limited entries are summarized here as one
+        {"suppressed": n} entry per category.
+        
         Returns:
             None
         """
-        if not self.snapshots:
-            return
+        timestamp = time.time()
+        self._flush_log_buffer()  # Pull in everything logged up to now
+        now_ns = time.monotonic_ns()
+        with self.log_lock:
+            # The interval restarts even when there is nothing to snapshot, so an idle
+            # game doesn't retry on every flusher tick
+            self.last_snapshot_ns = now_ns
+            suppressed = self._suppressed_pending
+            self._suppressed_pending = {}
+            # Flushes queued after this clears the flag set it again, so their
+            # entries are picked up by this snapshot or the next one
+            has_entries = self._entries_since_snapshot
+            self._entries_since_snapshot = False
+        
+        if not has_entries and not suppressed:
+            return  # Nothing logged since the last snapshot
+        
+        if suppressed:
+            categories = list(suppressed)
+            summaries = ([now_ns] * len(categories), categories,
+                         [{"suppressed": count} for count in suppressed.values()],
+                         ["low"] * len(categories))
+            self._io_queue.put((self._write_log_entries, ([summaries],)))
             
-        snapshot_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-        snapshot_file = os.path.join(self.snapshots_directory, f"snapshot_{snapshot_time}.json")
+        self._io_queue.put((self._write_snapshot, (timestamp,)))
+    
+    def _write_snapshot(self, timestamp):
+        """Write the entry records grouped since the last snapshot, with its duplet, to disk."""
+        # Jobs run in order, so every flush queued before this snapshot is grouped
+        by_cat = self._snapshot_by_cat
+        if not by_cat:
+            return
+        self._snapshot_by_cat = collections.defaultdict(list)
+        
+        snapshot_time = time.strftime("%Y%m%d_%H%M%S", time.localtime(timestamp))
         
-        # Group logs by category for better analysis
-        categorized_data = {}
-        for entry in self.snapshots:
-            category = entry["category"]
-            if category not in categorized_data:
-                categorized_data[category] = []
-            categorized_data[category].append(entry)
+        # Several snapshots can land in the same second (e.g. the final one at exit);
+        # suffix later ones so each snapshot_time stays unique
+        if snapshot_time == self._last_snapshot_second:
+            self._snapshot_suffix += 1
+            snapshot_time = f"{snapshot_time}_{self._snapshot_suffix}"
+        else:
+            self._last_snapshot_second = snapshot_time
+            self._snapshot_suffix = 0
+        
+        # Records were grouped in flush order, so each category is already in time order
+        categorized_data = {
+            category: [
+                {"timestamp": ts, "category": category, "data": data, "priority": priority}
+                for ts, _, data, priority in records
+            ]
+            for category, records in by_cat.items()
+        }
         
-        # Save snapshot to file with detailed metadata
+        # Save snapshot with detailed metadata
         snapshot_data = {
-            "timestamp": time.time(),
+            "kind": "snapshot",
+            "timestamp": timestamp,
             "snapshot_time": snapshot_time,
             "session_id": self.session_id,
             "snapshot_data": categorized_data
         }
         
-        # Save snapshot to file
-        with open(snapshot_file, "w") as f:
-            json.dump(snapshot_data, f, indent=2, cls=CustomJSONEncoder)
-            
-        # For backward compatibility, also create a copy in the original location
-        compat_snapshot_file = os.path.join(self.log_directory, f"snapshot_{snapshot_time}.json")
-        with open(compat_snapshot_file, "w") as f:
-            json.dump(snapshot_data, f, indent=2, cls=CustomJSONEncoder)
+        # Pair this snapshot with the most recent log chunk. The duplet is embedded in
+        # the snapshot rather than written as a separate file, and shares its
+        # session_id, timestamp and snapshot_time instead of repeating them.
+        if self._last_chunk_file is not None:
+            snapshot_data["duplet"] = {
+                "snapshot_file": self.journal_path,
+                "log_chunk": self._last_chunk_file,
+                "categories": list(categorized_data.keys())
+            }
+            self._duplet_count += 1
         
-        # Create a duplet by pairing this snapshot with recent logs
-        self._create_snapshot_log_duplet(snapshot_data, snapshot_time)
-            
-        # Clear snapshots after saving
-        self.snapshots = []
-        logger.debug(f"Created game state snapshot: {snapshot_file}")
-    
-    def _create_snapshot_log_duplet(self, snapshot_data, snapshot_time):
-        """Create a duplet by pairing this snapshot with recently cached logs."""
-        # Get the most recent log chunk
-        cache_files = [f for f in os.listdir(self.cache_directory) if f.endswith(".gz")]
-        if not cache_files:
-            return
+        # Append the snapshot to the session journal. Snapshots are read by the
+        # analysis tools rather than by people, so they are written compact.
+        payload = _json_bytes(snapshot_data)
+        self._append_journal(payload)
+        self._snapshot_count += 1
             
-        # Sort by time and get the most recent
-        cache_files.sort(reverse=True)
-        if not cache_files:
-            return
+        # For backward compatibility, also expose it as a file in the original location
+        if self.legacy_compat:
+            compat_snapshot_file = os.path.join(self.log_directory, f"snapshot_{snapshot_time}.json")
+            with open(compat_snapshot_file, 'wb') as f:
+                f.write(payload)
             
-        recent_chunk = cache_files[0]
-        
-        # Create a duplet file
-        duplet_file = os.path.join(self.duplets_directory, f"duplet_{snapshot_time}.json")
+        logger.debug("Created game state snapshot {} in {}", snapshot_time, self.journal_path)
+    
+    def _append_journal(self, record):
+        """Append one serialized record to the session journal.
         
-        # Create duplet metadata
-        duplet_data = {
-            "snapshot_file": os.path.join(self.snapshots_directory, f"snapshot_{snapshot_time}.json"),
-            "log_chunk": os.path.join(self.cache_directory, recent_chunk),
-            "timestamp": time.time(),
-            "snapshot_time": snapshot_time,
-            "session_id": self.session_id,
-            "categories": list(snapshot_data["snapshot_data"].keys())
-        }
+        The journal is opened once and each record is a single buffered write, so a
+        snapshot costs no file creation. Flushing after every record keeps the
+        journal readable by other processes while the game runs.
+        """
+        journal = self._journal
+        if journal is None:
+            journal = self._journal = open(self.journal_path, 'ab')
+        journal.write(record + b"\n")
+        journal.flush()
+    
+    def _link_compat_file(self, source_file, compat_file, payload):
+        """Expose source_file at a legacy path, hardlinking instead of rewriting it.
         
-        # Save duplet
-        with open(duplet_file, "w") as f:
-            json.dump(duplet_data, f, indent=2, cls=CustomJSONEncoder)
-            
-        logger.debug(f"Created snapshot-log duplet: {duplet_file}")
-
+        A hardlink is a metadata-only operation; filesystems that don't support
+        links get the already-serialized payload written out in a single call.
+        """
+        try:
+            try:
+                os.remove(compat_file)  # Replace any earlier copy
+            except FileNotFoundError:
+                pass
+            os.link(source_file, compat_file)
+        except (OSError, NotImplementedError):
+            with open(compat_file, 'wb') as f:
+                f.write(payload)
+    
     def log_player_state(self, player):
         """Log comprehensive player state information."""
         self.debug("player", {
@@ -595,7 +1408,7 @@ class GameLogger:
         """Log when an enemy is spawned with detailed information."""
         self.debug("enemy_spawn", {
             "type": enemy.type,
-            "id": id(enemy),
+            "id": log_id(enemy),
             "health": enemy.health,
             "damage": enemy.damage,
             "position": {"x": enemy.rect.x, "y": enemy.rect.y},
@@ -604,22 +1417,23 @@ class GameLogger:
     
     def log_combat_event(self, attacker, defender, damage, damage_type, result):
         """Log detailed combat interaction."""
+        get = result.get
         self.debug("combat", {
-            "attacker": attacker.type if hasattr(attacker, "type") else "player",
-            "attacker_id": id(attacker),
-            "defender": defender.type if hasattr(defender, "type") else "player",
-            "defender_id": id(defender),
+            "attacker": getattr(attacker, "type", "player"),
+            "attacker_id": log_id(attacker),
+            "defender": getattr(defender, "type", "player"),
+            "defender_id": log_id(defender),
             "damage_attempted": damage,
             "damage_type": damage_type,
-            "actual_damage": result.get("actual_damage", 0),
-            "resistance_applied": result.get("resistance_applied", 0),
-            "effects": result.get("effects", [])
+            "actual_damage": get("actual_damage", 0),
+            "resistance_applied": get("resistance_applied", 0),
+            "effects": get("effects", ())  # Shared empty default, no per-call list
         }, "high")
     
     def log_area_transition(self, player, old_area, new_area):
         """Log when player transitions between game areas."""
         self.debug("area_transition", {
-            "player_id": id(player),
+            "player_id": log_id(player),
             "old_area": old_area,
             "new_area": new_area,
             "player_health": player.health,
@@ -636,6 +1450,17 @@ class GameLogger:
             "hazards": [h.type for h in environmental_hazards] if environmental_hazards else []
         }, "normal")
 
+    def _get_visualizer(self):
+        """Return this logger's GameStateVisualizer, creating it on first use."""
+        visualizer = getattr(self, "_visualizer", None)
+        if visualizer is None:
+            # Lazy import to avoid circular imports
+            from visualization import GameStateVisualizer
+            
+            # Create visualizer with this logger instance
+            visualizer = self._visualizer = GameStateVisualizer(self)
+        return visualizer
+
     def visualize_game_data(self, metric_name="player_health", session_id=None):
         """
         Create and display a visualization of game data using the calculus analogy.
@@ -648,23 +1473,15 @@ class GameLogger:
             str: Path to the saved visualization, or None if visualization failed
         """
         try:
-            # Lazy import to avoid circular imports
-            from visualization import GameStateVisualizer
-            
-            # Create visualizer with this logger instance
-            visualizer = GameStateVisualizer(self)
+            visualizer = self._get_visualizer()
             
-            # Create exports directory if it doesn't exist
-            export_dir = os.path.join(self.log_directory, "exports")
-            if not os.path.exists(export_dir):
-                os.makedirs(export_dir)
+            # The exports directory was created with the logger
+            export_dir = self.exports_directory
             
             # Create visualization
             if session_id is None:
-                sessions = self.get_cached_sessions()
-                if sessions:
-                    session_id = sessions[-1]['session_id']  # Use most recent
-                else:
+                session_id = self.get_latest_session_id()  # Use most recent
+                if session_id is None:
                     logger.warning("No game sessions found to visualize")
                     return None
             
@@ -695,23 +1512,15 @@ class GameLogger:
             str: Path to the saved visualization, or None if visualization failed
         """
         try:
-            # Lazy import to avoid circular imports
-            from visualization import GameStateVisualizer
-            
-            # Create visualizer with this logger instance
-            visualizer = GameStateVisualizer(self)
+            visualizer = self._get_visualizer()
             
-            # Create exports directory if it doesn't exist
-            export_dir = os.path.join(self.log_directory, "exports")
-            if not os.path.exists(export_dir):
-                os.makedirs(export_dir)
+            # The exports directory was created with the logger
+            export_dir = self.exports_directory
             
             # Use most recent session if none specified
             if session_id is None:
-                sessions = self.get_cached_sessions()
-                if sessions:
-                    session_id = sessions[-1]['session_id']
-                else:
+                session_id = self.get_latest_session_id()
+                if session_id is None:
                     logger.warning("No game sessions found to visualize")
                     return None
             
@@ -737,16 +1546,10 @@ class GameLogger:
             str: Path to the saved visualization
         """
         try:
-            # Lazy import to avoid circular imports
-            from visualization import GameStateVisualizer
+            visualizer = self._get_visualizer()
             
-            # Create visualizer with this logger instance
-            visualizer = GameStateVisualizer(self)
-            
-            # Create exports directory if it doesn't exist
-            export_dir = os.path.join(self.log_directory, "exports")
-            if not os.path.exists(export_dir):
-                os.makedirs(export_dir)
+            # The exports directory was created with the logger
+            export_dir = self.exports_directory
             
             # Generate the visualization
             save_path = os.path.join(export_dir, "calculus_analogy.png")
@@ -762,84 +1565,376 @@ class GameLogger:
             logger.error(f"Visualization error: {str(e)}")
             return None
 
-    def _flush_log_buffer(self):
-        """Flush the log buffer to disk in bulk."""
-        if not self.log_buffer:
+    def _flush_log_buffer(self, now_ns=None, block=True):
+        """Hand the buffered log entries to the background writer.
+        
+        Each thread's ring is drained up to its current tail without blocking the
+        producer, which keeps appending behind it. Only the drain happens on the
+        calling thread; merging, snapshot grouping, serialization and disk I/O
+        (including chunk compression) are deferred to the writer thread.
+        
+        Args:
+            now_ns (int): Current time.monotonic_ns(), if the caller already has it
+            block (bool): Whether to wait for log_lock and for room in the writer's
+                queue. Without it, a concurrent flush or a backed-up writer (e.g. one
+                compressing a chunk) makes this a no-op and the entries stay in the
+                rings for a later flush.
+        """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        if not block and self._io_queue.full():
+            return  # Retried on the next flusher tick or size trigger
+        drained_buffers = []
+        taken_tails = []  # (buffer, tail) to consume once the entries are queued
+        dropped = 0
+        # Without block, a flush or snapshot holding the lock means the caller (the
+        # game thread) hands the work to the flusher rather than waiting for it
+        log_lock = self.log_lock
+        if not log_lock.acquire(block):
+            self._flush_requested.set()
             return
+        try:
+            pending = self._suppressed_pending
+            for buf in self._thread_buffers:
+                taken = buf.peek()
+                if taken:
+                    drained_buffers.append(taken[0])
+                    taken_tails.append((buf, taken[1]))
+                
+                # Pick up what the owner thread has counted since the last flush
+                dropped_total = buf.dropped
+                dropped += dropped_total - buf.dropped_seen
+                buf.dropped_seen = dropped_total
+                seen = buf.suppressed_seen
+                for category, bucket in buf.rate_buckets.copy().items():  # Owner may add keys
+                    total = bucket[2]
+                    new = total - seen.get(category, 0)
+                    if new:
+                        pending[category] = pending.get(category, 0) + new
+                        seen[category] = total
             
-        # Add to the log cache before processing
-        with self.log_lock:
-            self.log_cache.extend(self.log_buffer)
-            
-            # Check if we need to compress the cache
-            if len(self.log_cache) >= self.cache_size_limit:
-                self.compress_cache_chunk()
-        
-        # Group by category for cleaner logs
-        by_category = {}
-        for entry in self.log_buffer:
-            category = entry['category']
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(entry)
-        
-        # Log each category in bulk
-        for category, entries in by_category.items():
-            if len(entries) == 1:
+            if drained_buffers:
+                job = (self._write_log_entries, (drained_buffers,))
+                if not block:
+                    # Queued under the lock so the entries are consumed only once the
+                    # writer has them; on a full queue they stay in the rings
+                    try:
+                        self._io_queue.put_nowait(job)
+                    except queue.Full:
+                        drained_buffers = taken_tails = None
+                if taken_tails:
+                    for buf, tail in taken_tails:
+                        buf.head = tail
+            
+            # Forget buffers whose threads have exited once they are drained
+            self._thread_buffers = [buf for buf in self._thread_buffers
+                                    if buf.head != buf.tail or buf.thread.is_alive()]
+            
+            # Report overflow at most once per second so drops are visible but quiet
+            self.dropped_count += dropped
+            self._dropped_since_report += dropped
+            if (self._dropped_since_report and
+                    now_ns - self._last_drop_report_ns >= 1_000_000_000):
+                logger.warning(f"Log buffer overflow: dropped {self._dropped_since_report} entries "
+                               f"({self.dropped_count} this session)")
+                self._dropped_since_report = 0
+                self._last_drop_report_ns = now_ns
+        finally:
+            log_lock.release()
+            
+        if drained_buffers:
+            if block:
+                self._io_queue.put(job)
+            self._entries_since_snapshot = True  # Set after queueing; see create_snapshot
+    
+    def _write_log_entries(self, drained_buffers):
+        """Write flushed entries to the log file in bulk, then add them to the log cache.
+        
+        Runs on the writer thread. A single drained ring's columns are zipped into
+        rows as-is; rings from several threads are each already in time order, so
+        their rows are merged rather than re-sorted. Entries are also appended to the
+        columnar log cache and grouped for the next snapshot here.
+        
+        Args:
+            drained_buffers (list): (timestamps, categories, datas, priorities)
+                column tuples, each in time order, with monotonic ns timestamps
+        """
+        # Convert each column of monotonic timestamps to wall-clock seconds in bulk
+        offset_ns = self._wall_clock_offset_ns
+        drained_buffers = [([(ns + offset_ns) / 1e9 for ns in timestamps], categories, datas, priorities)
+                           for timestamps, categories, datas, priorities in drained_buffers]
+        
+        if len(drained_buffers) == 1:
+            columns = drained_buffers[0]
+            rows = zip(*columns)
+        else:
+            rows = list(heapq.merge(*(zip(*columns) for columns in drained_buffers),
+                                    key=_row_timestamp))
+            columns = tuple(zip(*rows))
+        
+        # The cache is columnar too, so adding to it is one bulk extend per column
+        timestamps, categories, datas, priorities = columns
+        self._cache_timestamps.extend(timestamps)
+        self._cache_categories.extend(categories)
+        self._cache_datas.extend(datas)
+        self._cache_priorities.extend(priorities)
+        
+        # Add rows to the pending snapshot. Each category maps to its bound snapshot
+        # append, so a row costs one dict lookup; the only other bookkeeping is where
+        # this flush's rows start in each category's list. (Sorting by category and
+        # extending per groupby run measured about twice as slow for interleaved
+        # categories at every flush size, and only wins on long same-category runs.)
+        appends = {}
+        starts = {}
+        snapshot_by_cat = self._snapshot_by_cat
+        for row in rows:
+            append = appends.get(row[1])
+            if append is None:
+                records = snapshot_by_cat[row[1]]
+                starts[row[1]] = len(records)
+                append = appends[row[1]] = records.append
+            append(row)
+        
+        # Log every category's lines as one message, so a flush costs one trip through
+        # loguru's handlers. The message, down to finding each category's first and
+        # last rows, is only built if a sink accepts DEBUG records.
+        if self._flush_log_enabled:
+            _lazy_logger.debug("{}", lambda: self._format_bulk_log(snapshot_by_cat, starts))
+        
+        if len(self._cache_timestamps) >= self.cache_size_limit:
+            self.compress_cache_chunk()
+    
+    def _format_bulk_log(self, records_by_cat, starts):
+        """Format a flush's log lines, one per category, as a single message.
+        
+        A category with several entries in the flush is summarized by its first and
+        last entries plus up to bulk_log_samples entries sampled from in between.
+        
+        Args:
+            records_by_cat (dict): Category -> rows grouped for the pending snapshot
+            starts (dict): Category -> index of the flush's first row in those rows
+        """
+        lines = []
+        append = lines.append
+        prefixes = _bulk_log_prefixes
+        for category, start in starts.items():
+            records = records_by_cat[category]
+            count = len(records) - start
+            first = records[start]
+            if count == 1:
                 # Single entry - log normally
-                entry = entries[0]
-                message = f"[{category}] {json.dumps(entry['data'], cls=CustomJSONEncoder)}"
-                logger.debug(message)
+                payload = first[2]
             else:
-                # Multiple entries - log count and first/last
-                message = f"[{category}] Bulk log: {len(entries)} entries from {entries[0]['timestamp']} to {entries[-1]['timestamp']}"
-                logger.debug(message)
-                
-                # Log first and last entry in detail
-                logger.debug(f"[{category}] First: {json.dumps(entries[0]['data'], cls=CustomJSONEncoder)}")
-                logger.debug(f"[{category}] Last: {json.dumps(entries[-1]['data'], cls=CustomJSONEncoder)}")
+                # Multiple entries - one summary with the first, last and a few
+                # sampled entries in detail, encoded in a single call
+                last = records[-1]
+                payload = {"count": count, "from": first[0], "to": last[0], "first": first[2]}
+                middle = range(start + 1, len(records) - 1)
+                if middle:
+                    picks = sorted(random.sample(middle, min(self.bulk_log_samples, len(middle))))
+                    payload["sample"] = [records[i][2] for i in picks]
+                payload["last"] = last[2]
+            prefix = prefixes.get(category)
+            if prefix is None:
+                prefix = prefixes[category] = f"[{category}] ".encode()
+            append(prefix + _json_bytes(payload))
+        # Lines are joined as bytes, straight from the encoder, and decoded once
+        return b"\n".join(lines).decode()
+    
+    def _open_export(self, output_file, compressed, text=False):
+        """Open an export file for writing, zstd-compressing it when requested.
         
-        # Clear buffer
-        self.log_buffer = []
+        The file gets one large buffer and nothing is layered on top of it, except
+        that compressed text exports wrap the compressor in a text stream.
+        """
+        if not compressed:
+            if text:
+                return open(output_file, 'w', encoding="utf-8", newline="",
+                            buffering=self.export_buffer_size)
+            return open(output_file, 'wb', buffering=self.export_buffer_size)
+        cctx = zstd.ZstdCompressor(level=self.export_zstd_level, threads=-1)
+        f = cctx.stream_writer(open(output_file, 'wb', buffering=self.export_buffer_size))
+        if text:
+            return io.TextIOWrapper(f, encoding="utf-8", newline="")
+        return f
+    
+    def _write_csv_export(self, f, sample, logs):
+        """Write log entries as CSV rows, with data columns taken from the first entry.
+        
+        With csv_no_quote set, cells are joined with commas as-is and each batch of
+        rows is written in one call. Otherwise pandas is used when it is available:
+        entries are converted to columns in batches and written by its C writer, so
+        no per-row lists or per-cell formatting calls are made in Python. Failing
+        that, rows are built in Python and handed to the csv module.
+        """
+        header = ["timestamp", "category", "priority"]
+        data_keys = ()
+        if isinstance(sample.get("data"), dict):
+            data_keys = tuple(sample["data"].keys())
+            header.extend(f"data.{key}" for key in data_keys)
+        # Entries logged from the same call site share the sample's key order, so
+        # their values can be mapped straight through without a lookup per key
+        key_order = list(data_keys)
+        
+        if self.csv_no_quote:
+            _cell = _csv_cell
+            
+            def _line(log):
+                try:
+                    cells = [*map(_cell, _csv_base_cells(log))]
+                except KeyError:
+                    get = log.get
+                    cells = [_cell(get("timestamp", "")), _cell(get("category", "")),
+                             _cell(get("priority", ""))]
+                data = log.get("data")
+                if isinstance(data, dict):
+                    if list(data) == key_order:
+                        cells.extend(map(_cell, data.values()))
+                    else:
+                        data_get = data.get
+                        cells.extend(_cell(data_get(key, "")) for key in data_keys)
+                return ",".join(cells)
+            
+            write = f.write
+            write(",".join(header) + "\r\n")
+            while True:
+                lines = [_line(log) for log in itertools.islice(logs, self.csv_export_batch_rows)]
+                if not lines:
+                    break
+                lines.append("")  # Terminate the last row too
+                write("\r\n".join(lines))
+            return
+        
+        try:
+            import pandas as pd
+        except ImportError:
+            pd = None
+        
+        if pd is not None:
+            empty = {}
+            _cell = _csv_cell
+            write_header = True
+            while True:
+                batch = list(itertools.islice(logs, self.csv_export_batch_rows))
+                if not batch:
+                    break
+                try:
+                    timestamps, categories, priorities = zip(*map(_csv_base_cells, batch))
+                except KeyError:
+                    timestamps = [log.get("timestamp", "") for log in batch]
+                    categories = [log.get("category", "") for log in batch]
+                    priorities = [log.get("priority", "") for log in batch]
+                columns = {"timestamp": timestamps, "category": categories, "priority": priorities}
+                datas = [data if isinstance(data, dict) else empty
+                         for data in (log.get("data") for log in batch)]
+                for key in data_keys:
+                    column = [data.get(key, "") for data in datas]
+                    # Nested values are JSON-encoded; scalars are left for pandas to format
+                    if not _CSV_PANDAS_TYPES.issuperset(map(type, column)):
+                        column = [_cell(value) for value in column]
+                    columns[f"data.{key}"] = column
+                # Object columns keep each value's own str(), matching the csv path
+                frame = pd.DataFrame(columns, columns=header, dtype=object, copy=False)
+                frame.to_csv(f, header=write_header, index=False, lineterminator="\r\n")
+                write_header = False
+            return
+        
+        import csv
+        writer = csv.writer(f)
+        # Write header
+        writer.writerow(header)
+        
+        _cell = _csv_cell
+        
+        def _row(log):
+            try:
+                row = [*_csv_base_cells(log)]
+            except KeyError:
+                get = log.get
+                row = [get("timestamp", ""), get("category", ""), get("priority", "")]
+            data = log.get("data")
+            if isinstance(data, dict):
+                if list(data) == key_order:
+                    row.extend(map(_cell, data.values()))
+                else:
+                    data_get = data.get
+                    row.extend(_cell(data_get(key, "")) for key in data_keys)
+            return row
+        
+        # Write all data rows in one call so csv stays in its C loop
+        writer.writerows(_row(log) for log in logs)
     
     def export_session_data(self, session_id, output_format="json"):
-        """Export session data to a file in the specified format."""
-        logs = self.load_session_logs(session_id)
-        if not logs:
+        """Export session data to a file in the specified format.
+        
+        Supported formats are json, jsonl (also accepted as ndjson), msgpack and csv;
+        append ".zst" (e.g. "jsonl.zst") to zstd-compress the export as it is written.
+        Only json holds the whole session in one document; the others can be read
+        back an entry at a time. msgpack is the compact choice for archiving; the
+        text formats are for people and other tools.
+        """
+        base_format, _, compression = output_format.partition(".")
+        if base_format not in ("json", "jsonl", "ndjson", "msgpack", "csv") or compression not in ("", "zst"):
+            logger.error(f"Unsupported export format: {output_format}")
+            return None
+        if compression and zstd is None:
+            logger.error("Compressed export requires the zstandard package")
+            return None
+        if base_format == "msgpack" and msgpack is None:
+            logger.error("msgpack export requires the msgpack package")
+            return None
+        
+        # Stream entries in timestamp order rather than materializing the session
+        logs = self.iter_session_logs(session_id)
+        sample = next(logs, None)
+        if sample is None:
             return None
             
-        # Create exports directory if it doesn't exist
-        exports_dir = os.path.join(self.log_directory, "exports")
-        if not os.path.exists(exports_dir):
-            os.makedirs(exports_dir)
+        # The exports directory was created with the logger
+        exports_dir = self.exports_directory
             
         output_file = os.path.join(exports_dir, f"{session_id}_export.{output_format}")
         
-        if output_format == "json":
-            with open(output_file, 'w') as f:
-                json.dump(logs, f, cls=CustomJSONEncoder)
-        elif output_format == "csv":
-            import csv
-            with open(output_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                # Write header
-                if logs:
-                    sample = logs[0]
-                    header = ["timestamp", "category", "priority"]
-                    if "data" in sample and isinstance(sample["data"], dict):
-                        for key in sample["data"].keys():
-                            header.append(f"data.{key}")
-                    writer.writerow(header)
-                    
-                    # Write data rows
-                    for log in logs:
-                        row = [log.get("timestamp", ""), log.get("category", ""), log.get("priority", "")]
-                        if "data" in log and isinstance(log["data"], dict):
-                            for key in sample["data"].keys():
-                                row.append(str(log["data"].get(key, "")))
-                        writer.writerow(row)
+        # Entries are encoded and written a batch at a time, which keeps per-entry
+        # work to the encoder itself
+        batch_size = self.export_batch_entries
+        with self._open_export(output_file, bool(compression), base_format == "csv") as f:
+            if base_format == "json":
+                # A batch is encoded as one JSON array in a single encoder call; its
+                # brackets are dropped to splice the entries into the export's array
+                write = f.write
+                write(b"[" + _json_bytes(sample))
+                for batch in _batches(logs, batch_size):
+                    write(b"," + _json_bytes(batch)[1:-1])
+                write(b"]")
+            elif base_format in ("jsonl", "ndjson"):
+                # One object per line: no delimiters to track and appendable by consumers
+                write = f.write
+                for batch in _batches(itertools.chain((sample,), logs), batch_size):
+                    write(b"\n".join(map(_json_bytes, batch)) + b"\n")
+            elif base_format == "msgpack":
+                # Back-to-back msgpack objects, one per entry; read with msgpack.Unpacker
+                pack = msgpack.Packer(use_bin_type=True, default=_json_default).pack
+                write = f.write
+                for batch in _batches(itertools.chain((sample,), logs), batch_size):
+                    write(b"".join(map(pack, batch)))
+            elif base_format == "csv":
+                self._write_csv_export(f, sample, itertools.chain((sample,), logs))
         
         return output_file
 
-# Global instance for easy access
-game_logger = GameLogger()
+# Global instance for easy access. It is created on first access (PEP 562), so
+# importing this module only for its helpers starts no session: no directories,
+# log files or background threads.
+_game_logger_lock = threading.Lock()
+
+def __getattr__(name):
+    """Create the global GameLogger the first time game_logger is looked up."""
+    if name == "game_logger":
+        with _game_logger_lock:
+            instance = globals().get("game_logger")
+            if instance is None:
+                instance = GameLogger()
+                globals()["game_logger"] = instance  # Later lookups skip this hook
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
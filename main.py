@@ -5,6 +5,7 @@ import time
 import os
 from logger import game_logger
 from entities import Player, Enemy, AreaPortal
+from input_tracker import FrameInputCache
 from tutorial import Tutorial
 
 # Check for development tutorial mode
@@ -36,6 +37,9 @@ class Game:
         self.clock = pygame.time.Clock()
         self.fps = 60
         
+        # Input state shared by everything that reads it within a frame
+        self.frame_input = FrameInputCache()
+        
         # Game state
         self.running = True
         self.current_area = "BEACH"
@@ -88,6 +92,18 @@ class Game:
         self.splash_font = pygame.font.SysFont(None, 36)
         self.splash_messages = []
         
+        # Fonts for the HUD and overlays, loaded once rather than every frame
+        self.debug_font = pygame.font.SysFont(None, 20)
+        self.title_font = pygame.font.Font(None, 72)
+        self.heading_font = pygame.font.Font(None, 48)
+        self.info_font = pygame.font.Font(None, 36)
+        self.small_font = pygame.font.Font(None, 28)
+        self.content_font = pygame.font.Font(None, 24)
+        # Rendered text surfaces by (font, text, color); most HUD and overlay text is
+        # the same from frame to frame, so it is only rasterized when it changes
+        self.text_surfaces = {}
+        self.text_cache_limit = 256
+        
         # Game time tracking for debug
         self.start_time = time.time()
         self.last_log_time = self.start_time
@@ -195,6 +211,7 @@ class Game:
     def handle_events(self):
         """Handle pygame events"""
         events = pygame.event.get()
+        self.frame_input.tick()
         for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
@@ -280,22 +297,24 @@ class Game:
             self.tutorial.draw(self.screen)
             
             # Make sure to update the tutorial with the events
-            self.tutorial.update(events, pygame.key.get_pressed())
+            self.tutorial.update(events, self.frame_input.keys)
         
         return events
     
     def handle_mouse_attack(self, mouse_pos):
         """Handle mouse click attacks on enemies"""
+        attack_range = 60  # Attack radius
+        player_x, player_y = self.player.rect.topleft
+        
         # Find enemies that were clicked on
         for enemy in self.enemies:
             if enemy.rect.collidepoint(mouse_pos):
-                # Calculate distance to enemy
-                dx = enemy.rect.x - self.player.rect.x
-                dy = enemy.rect.y - self.player.rect.y
-                distance = (dx ** 2 + dy ** 2) ** 0.5
+                # Calculate distance to enemy, squared to skip the square root
+                dx = enemy.rect.x - player_x
+                dy = enemy.rect.y - player_y
                 
                 # Only attack if player is close enough
-                if distance <= 60:  # Attack range
+                if dx * dx + dy * dy <= attack_range * attack_range:
                     result = self.player.attack(enemy)
                     
                     # Add splash message for special effects
@@ -308,14 +327,14 @@ class Game:
         """Handle player attacking nearby enemies"""
         attack_range = 60  # Attack radius
         attack_count = 0
+        player_x, player_y = self.player.rect.topleft
         
         for enemy in self.enemies:
-            # Calculate distance to enemy
-            dx = enemy.rect.x - self.player.rect.x
-            dy = enemy.rect.y - self.player.rect.y
-            distance = (dx ** 2 + dy ** 2) ** 0.5
+            # Calculate distance to enemy, squared to skip the square root
+            dx = enemy.rect.x - player_x
+            dy = enemy.rect.y - player_y
             
-            if distance <= attack_range:
+            if dx * dx + dy * dy <= attack_range * attack_range:
                 result = self.player.attack(enemy)
                 attack_count += 1
                 
@@ -407,7 +426,7 @@ class Game:
             return  # Stop updating game if player is dead
             
         # Process input
-        keys = pygame.key.get_pressed()
+        keys = self.frame_input.keys
         
         # Only update player if not in tutorial or tutorial is inactive
         if not self.tutorial.active:
@@ -492,8 +511,9 @@ class Game:
         # Fill the background with area color
         screen.fill(self.area_colors.get(self.current_area, (0, 0, 0)))
         
-        # Draw all sprites
-        self.all_sprites.draw(screen)
+        # Draw all sprites in one blits call. Group.draw would also return and store
+        # each sprite's rect for dirty-rect updates, which a full-frame flip never uses.
+        screen.blits([(sprite.image, sprite.rect) for sprite in self.all_sprites], doreturn=False)
         
         # Draw splash messages
         current_time = time.time()
@@ -529,6 +549,18 @@ class Game:
         if self.debug_mode:
             self.draw_debug_info(screen)
             
+    def render_text(self, font, text, color):
+        """Render antialiased text, reusing the surface if it was drawn before"""
+        key = (font, text, color)
+        surface = self.text_surfaces.get(key)
+        if surface is None:
+            # Drop everything once the cache is full; text still on screen is simply
+            # rendered again on the next frame
+            if len(self.text_surfaces) >= self.text_cache_limit:
+                self.text_surfaces.clear()
+            surface = self.text_surfaces[key] = font.render(text, True, color)
+        return surface
+    
     def draw_notification(self, screen=None):
         """Draw any active notification on the screen"""
         # Set screen to self.screen if not provided
@@ -542,8 +574,7 @@ class Game:
             screen.blit(notification_bg, (0, self.height - 40))
             
             # Draw the message
-            font = pygame.font.Font(None, 28)
-            text = font.render(self.notification_message, True, (200, 255, 200))
+            text = self.render_text(self.small_font, self.notification_message, (200, 255, 200))
             screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height - 30))
             
             # Calculate and show remaining time
@@ -569,7 +600,7 @@ class Game:
         
         # Draw health text
         health_text = f"Health: {max(0, int(self.player.health))}/{self.player.max_health}"
-        health_surface = self.splash_font.render(health_text, True, (255, 255, 255))
+        health_surface = self.render_text(self.splash_font, health_text, (255, 255, 255))
         screen.blit(health_surface, (180, 20))
         
         # Draw wetness meter if player has any wetness
@@ -581,25 +612,25 @@ class Game:
             pygame.draw.rect(screen, (0, 0, 255), (20, 50, wetness_width, 15))
             # Text
             wetness_text = f"Wetness: {int(self.player.wetness)}%"
-            wetness_surface = self.splash_font.render(wetness_text, True, (255, 255, 255))
+            wetness_surface = self.render_text(self.splash_font, wetness_text, (255, 255, 255))
             screen.blit(wetness_surface, (180, 45))
             
         # Draw fire resistance if player has any
         if self.player.fire_resistance > 0:
             resist_text = f"Fire Resist: {int(self.player.fire_resistance)}%"
-            resist_surface = self.splash_font.render(resist_text, True, (255, 200, 0))
+            resist_surface = self.render_text(self.splash_font, resist_text, (255, 200, 0))
             screen.blit(resist_surface, (20, 75))
             
         # Draw obsidian armor if player has any
         if self.player.obsidian_armor_level > 0:
             armor_text = f"Obsidian: {int(self.player.obsidian_armor_level)}%"
             armor_color = (100, 100, 100) if not self.player.has_obsidian_armor else (200, 200, 200)
-            armor_surface = self.splash_font.render(armor_text, True, armor_color)
+            armor_surface = self.render_text(self.splash_font, armor_text, armor_color)
             screen.blit(armor_surface, (20, 100))
             
         # Draw current area
         area_text = f"Area: {self.current_area}"
-        area_surface = self.splash_font.render(area_text, True, (255, 255, 255))
+        area_surface = self.render_text(self.splash_font, area_text, (255, 255, 255))
         screen.blit(area_surface, (self.width - area_surface.get_width() - 20, 20))
     
     def draw_debug_info(self, screen=None):
@@ -608,7 +639,6 @@ class Game:
         if screen is None:
             screen = self.screen
         
-        debug_font = pygame.font.SysFont(None, 20)
         y_offset = 10
         x_offset = 10
         
@@ -642,7 +672,7 @@ class Game:
         
         # Render debug texts
         for text in debug_texts:
-            debug_surface = debug_font.render(text, True, (255, 255, 255))
+            debug_surface = self.render_text(self.debug_font, text, (255, 255, 255))
             screen.blit(debug_surface, (x_offset, y_offset))
             y_offset += 14  # Line spacing
         
@@ -695,16 +725,16 @@ class Game:
         screen.blit(overlay, (0, 0))
         
         # Game over text
-        title_font = pygame.font.Font(None, 72)
-        info_font = pygame.font.Font(None, 36)
-        stats_font = pygame.font.Font(None, 28)
+        title_font = self.title_font
+        info_font = self.info_font
+        stats_font = self.small_font
         
         # Main title
-        game_over_text = title_font.render("GAME OVER", True, (255, 0, 0))
+        game_over_text = self.render_text(title_font, "GAME OVER", (255, 0, 0))
         screen.blit(game_over_text, (self.width // 2 - game_over_text.get_width() // 2, 100))
         
         # Cause of death with dynamic color
-        death_text = info_font.render(f"Cause of Death: {cause_of_death}", True, cause_color)
+        death_text = self.render_text(info_font, f"Cause of Death: {cause_of_death}", cause_color)
         screen.blit(death_text, (self.width // 2 - death_text.get_width() // 2, 180))
         
         # Game stats
@@ -718,13 +748,13 @@ class Game:
         ]
         
         for stat in stats:
-            stat_text = stats_font.render(stat, True, (200, 200, 200))
+            stat_text = self.render_text(stats_font, stat, (200, 200, 200))
             screen.blit(stat_text, (self.width // 2 - stat_text.get_width() // 2, y_offset))
             y_offset += 30
         
         # Add EAT LOGS button
         y_offset += 30
-        eat_logs_text = info_font.render("Press E - EAT LOGS", True, (150, 250, 150))
+        eat_logs_text = self.render_text(info_font, "Press E - EAT LOGS", (150, 250, 150))
         eat_logs_bg = pygame.Surface((eat_logs_text.get_width() + 20, eat_logs_text.get_height() + 10), pygame.SRCALPHA)
         eat_logs_bg.fill((0, 100, 0, 128))  # Dark green with transparency
         
@@ -738,16 +768,16 @@ class Game:
         
         # Add description
         y_offset += 60
-        description_text = stats_font.render("Analyze all gameplay data for patterns and insights", True, (180, 180, 180))
+        description_text = self.render_text(stats_font, "Analyze all gameplay data for patterns and insights", (180, 180, 180))
         screen.blit(description_text, (self.width // 2 - description_text.get_width() // 2, y_offset))
         
         # Exit instructions
-        exit_text = info_font.render("Press ESC to exit, or wait for auto-exit", True, (150, 150, 150))
+        exit_text = self.render_text(info_font, "Press ESC to exit, or wait for auto-exit", (150, 150, 150))
         screen.blit(exit_text, (self.width // 2 - exit_text.get_width() // 2, self.height - 100))
         
         # Add a countdown timer
         remaining_time = max(0, int(self.game_over_display_duration - (time.time() - self.game_over_time)))
-        timer_text = stats_font.render(f"Auto-exit in: {remaining_time} seconds", True, (150, 150, 150))
+        timer_text = self.render_text(stats_font, f"Auto-exit in: {remaining_time} seconds", (150, 150, 150))
         screen.blit(timer_text, (self.width // 2 - timer_text.get_width() // 2, self.height - 60))
         
         game_logger.debug("GAME_OVER_SCREEN_RENDERED", {
@@ -768,12 +798,12 @@ class Game:
         screen.blit(overlay, (0, 0))
         
         # Title and instructions
-        title_font = pygame.font.Font(None, 48)
-        info_font = pygame.font.Font(None, 28)
-        content_font = pygame.font.Font(None, 24)
+        title_font = self.heading_font
+        info_font = self.small_font
+        content_font = self.content_font
         
         # Title
-        title_text = title_font.render("LOG ANALYSIS RESULTS", True, (150, 220, 255))
+        title_text = self.render_text(title_font, "LOG ANALYSIS RESULTS", (150, 220, 255))
         screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, 20))
         
         # Instructions
@@ -785,7 +815,7 @@ class Game:
         instruction_y = 25
         
         for instruction in instructions:
-            instruction_text = info_font.render(instruction, True, (180, 180, 255))
+            instruction_text = self.render_text(info_font, instruction, (180, 180, 255))
             screen.blit(instruction_text, (instruction_x, instruction_y))
             instruction_y += 30
         
@@ -809,17 +839,17 @@ class Game:
                     header_line = section_lines[0].strip()
                     if len(header_line) > 3 and header_line[0] == '[' and header_line[-1] == ']':
                         # This is a section header
-                        header_text = info_font.render(header_line, True, (255, 255, 150))
                         if 80 <= y_offset <= self.height - 100:
+                            header_text = self.render_text(info_font, header_line, (255, 255, 150))
                             screen.blit(header_text, (60, y_offset))
                         y_offset += 30
                         section_lines = section_lines[1:]  # Skip the header for the content rendering
                 
                 # Draw the content
                 for line in section_lines:
-                    line_text = content_font.render(line, True, (200, 200, 220))
-                    # Only draw lines that are visible in the container
+                    # Only render and draw lines that are visible in the container
                     if 80 <= y_offset <= self.height - 100:
+                        line_text = self.render_text(content_font, line, (200, 200, 220))
                         screen.blit(line_text, (60, y_offset))
                     y_offset += 25
                 
@@ -838,7 +868,7 @@ class Game:
                     [(self.width//2 - 10, self.height - 85), (self.width//2 + 10, self.height - 85), (self.width//2, self.height - 75)])
         else:
             # No results yet, show loading message
-            loading_text = info_font.render("Processing logs, please wait...", True, (200, 200, 220))
+            loading_text = self.render_text(info_font, "Processing logs, please wait...", (200, 200, 220))
             screen.blit(loading_text, (self.width//2 - loading_text.get_width()//2, self.height//2))
         
         # Draw a "Close" button at the bottom
@@ -846,7 +876,7 @@ class Game:
         pygame.draw.rect(screen, (60, 60, 120), close_button_rect)
         pygame.draw.rect(screen, (100, 100, 200), close_button_rect, 2)  # Border
         
-        close_text = info_font.render("Close", True, (220, 220, 255))
+        close_text = self.render_text(info_font, "Close", (220, 220, 255))
         screen.blit(close_text, (self.width//2 - close_text.get_width()//2, self.height - 55))
     
     def analyze_logs_in_game(self):
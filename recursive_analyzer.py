@@ -31,7 +31,7 @@ import time
 from datetime import datetime
 from collections import defaultdict, Counter
 import numpy as np
-from logger import game_logger
+from logger import game_logger, read_session_journal
 
 
 class RecursiveAnalyzer:
@@ -343,16 +343,17 @@ class RecursiveAnalyzer:
             print(f"Error: Session directory not found for '{session_id}'")
             return []
         
-        # Load snapshots
+        # Load snapshots, from their own files in older sessions and from the
+        # session journal in newer ones
         snapshots_dir = os.path.join(session_dir, "snapshots")
-        if not os.path.exists(snapshots_dir):
-            print(f"Error: No snapshots directory found for session '{session_id}'")
-            return []
-            
-        snapshot_files = sorted([f for f in os.listdir(snapshots_dir) if f.endswith('.json')])
-        
-        if not snapshot_files:
-            print(f"Error: No snapshot files found for session '{session_id}'")
+        snapshot_files = []
+        if os.path.exists(snapshots_dir):
+            with os.scandir(snapshots_dir) as it:
+                snapshot_files = sorted(entry.name for entry in it if entry.name.endswith('.json'))
+        journal_snapshots = read_session_journal(session_dir, "snapshot")
+        
+        if not snapshot_files and not journal_snapshots:
+            print(f"Error: No snapshots found for session '{session_id}'")
             return []
             
         for snapshot_file in snapshot_files:
@@ -368,6 +369,10 @@ class RecursiveAnalyzer:
             except Exception as e:
                 print(f"Error loading snapshot {snapshot_file}: {e}")
         
+        for snapshot in journal_snapshots:
+            snapshot['timestamp'] = snapshot.get('snapshot_time')
+            snapshots.append(snapshot)
+        
         if not snapshots:
             print(f"Error: Failed to load any valid snapshots for session '{session_id}'")
             
@@ -407,17 +412,23 @@ class RecursiveAnalyzer:
             # Simplified for MVP - assumes snapshot is in the most recent session
             sessions_dir = os.path.join(game_logger.log_directory, "sessions")
             if os.path.exists(sessions_dir):
-                sessions = sorted([s for s in os.listdir(sessions_dir) 
-                                  if os.path.isdir(os.path.join(sessions_dir, s))])
-                if sessions:
-                    session_id = sessions[-1]
-                    snapshots_dir = os.path.join(sessions_dir, session_id, "snapshots")
-                    if os.path.exists(snapshots_dir):
+                # One pass over the directory; DirEntry knows its type without a stat
+                with os.scandir(sessions_dir) as it:
+                    session_id = max((entry.name for entry in it if entry.is_dir()), default=None)
+                if session_id:
+                    session_dir = os.path.join(sessions_dir, session_id)
+                    snapshot_file = os.path.join(session_dir, "snapshots", f"snapshot_{entity_id}.json")
+                    if os.path.exists(snapshot_file):
                         try:
-                            with open(os.path.join(snapshots_dir, f"snapshot_{entity_id}.json"), 'r') as f:
+                            with open(snapshot_file, 'r') as f:
                                 return json.load(f)
                         except Exception as e:
                             print(f"Error loading snapshot: {e}")
+                    else:
+                        # Newer sessions keep their snapshots in the session journal
+                        for snapshot in read_session_journal(session_dir, "snapshot"):
+                            if snapshot.get('snapshot_time') == entity_id:
+                                return snapshot
         elif level == "session":
             return {'snapshots': self._load_session_snapshots(entity_id)}
         elif level == "export":
@@ -0,0 +1,17 @@
+"""Shared fixtures for the test suite."""
+
+import atexit
+
+import pytest
+
+from logger import GameLogger
+
+
+@pytest.fixture
+def session_logger(tmp_path):
+    """A GameLogger writing under a temporary log root, finalized afterwards."""
+    instance = GameLogger(log_directory=str(tmp_path))
+    yield instance
+    if instance._writer_thread.is_alive():
+        instance.finalize_cache()
+    atexit.unregister(instance.finalize_cache)
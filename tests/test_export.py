@@ -0,0 +1,93 @@
+"""Round-trip tests for GameLogger.export_session_data."""
+
+import csv
+import io
+import json
+import sys
+
+import msgpack
+import pytest
+import zstandard as zstd
+
+COMPRESSIONS = ["", ".zst"]
+
+
+def _read_export(path):
+    with open(path, "rb") as f:
+        payload = f.read()
+    if path.endswith(".zst"):
+        payload = zstd.ZstdDecompressor().stream_reader(io.BytesIO(payload)).read()
+    return payload
+
+
+@pytest.fixture
+def exported_session(session_logger):
+    """A finalized session and the entries it logged, in logging order."""
+    for i in range(50):
+        # No value holds a comma or quote, so the unquoted CSV writer can export them too
+        session_logger.debug("player", {"hp": i, "state": "idle", "note": f"step {i}"})
+        session_logger.debug("enemy", {"hp": 100 - i, "state": "chase", "note": "near"})
+    session_logger.finalize_cache()
+    return session_logger, session_logger.load_session_logs(session_logger.session_id)
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_json_export_round_trip(exported_session, compression):
+    session_logger, entries = exported_session
+    path = session_logger.export_session_data(session_logger.session_id, "json" + compression)
+    assert json.loads(_read_export(path)) == entries
+
+
+@pytest.mark.parametrize("base_format", ["jsonl", "ndjson"])
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_jsonl_export_round_trip(exported_session, base_format, compression):
+    session_logger, entries = exported_session
+    path = session_logger.export_session_data(session_logger.session_id, base_format + compression)
+    lines = _read_export(path).splitlines()
+    assert [json.loads(line) for line in lines] == entries
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_msgpack_export_round_trip(exported_session, compression):
+    session_logger, entries = exported_session
+    path = session_logger.export_session_data(session_logger.session_id, "msgpack" + compression)
+    unpacker = msgpack.Unpacker(io.BytesIO(_read_export(path)), raw=False)
+    assert list(unpacker) == entries
+
+
+def _assert_csv_rows(payload, entries):
+    rows = list(csv.DictReader(io.StringIO(payload.decode("utf-8"), newline="")))
+    assert len(rows) == len(entries)
+    for row, entry in zip(rows, entries):
+        assert float(row["timestamp"]) == entry["timestamp"]
+        assert row["category"] == entry["category"]
+        assert row["priority"] == entry["priority"]
+        data = entry["data"]
+        assert row["data.hp"] == str(data["hp"])
+        assert row["data.state"] == data["state"]
+        assert row["data.note"] == data["note"]
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_csv_export_round_trip(exported_session, compression, monkeypatch):
+    session_logger, entries = exported_session
+    # Force the csv module writer even where pandas is installed
+    monkeypatch.setitem(sys.modules, "pandas", None)
+    path = session_logger.export_session_data(session_logger.session_id, "csv" + compression)
+    _assert_csv_rows(_read_export(path), entries)
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_csv_pandas_export_round_trip(exported_session, compression):
+    pytest.importorskip("pandas")
+    session_logger, entries = exported_session
+    path = session_logger.export_session_data(session_logger.session_id, "csv" + compression)
+    _assert_csv_rows(_read_export(path), entries)
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_csv_no_quote_export_round_trip(exported_session, compression):
+    session_logger, entries = exported_session
+    session_logger.csv_no_quote = True
+    path = session_logger.export_session_data(session_logger.session_id, "csv" + compression)
+    _assert_csv_rows(_read_export(path), entries)
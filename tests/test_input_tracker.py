@@ -0,0 +1,73 @@
+"""Tests for keyboard tracking in input_tracker."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from input_tracker import InputTracker
+
+
+class RecordingLogger:
+    """Stands in for game_logger, keeping each debug() call."""
+
+    def __init__(self):
+        self.records = []
+
+    def debug(self, category, data, priority="normal"):
+        self.records.append((category, data))
+
+    def entries(self, category):
+        return [data for logged, data in self.records if logged == category]
+
+
+class FakeInputCache:
+    """Input cache with a hand-made pressed-key array, indexed by scancode."""
+
+    def __init__(self):
+        self.keys = [False] * len(pygame.key.get_pressed())
+        self.mouse_pos = (0, 0)
+        self.mouse_buttons = (False, False, False)
+
+    def press(self, scancode, pressed=True):
+        self.keys[scancode] = pressed
+
+
+@pytest.fixture
+def tracker():
+    pygame.init()
+    recorder = RecordingLogger()
+    cache = FakeInputCache()
+    tracker = InputTracker(recorder, cache)
+    yield tracker, recorder, cache
+    pygame.quit()
+
+
+def test_state_changes_log_key_code_and_name(tracker):
+    tracker, recorder, cache = tracker
+    cache.press(pygame.KSCAN_A)
+    tracker.update()
+
+    changes = recorder.entries("INPUT_STATE_CHANGES")[-1]["key_changes"]
+    assert changes == [{"key_code": pygame.K_a, "key_name": "a", "pressed": True}]
+
+    cache.press(pygame.KSCAN_A, False)
+    tracker.update()
+
+    changes = recorder.entries("INPUT_STATE_CHANGES")[-1]["key_changes"]
+    assert changes == [{"key_code": pygame.K_a, "key_name": "a", "pressed": False}]
+
+
+def test_full_snapshot_names_pressed_scancodes(tracker):
+    tracker, recorder, cache = tracker
+    cache.press(pygame.KSCAN_A)
+    cache.press(pygame.KSCAN_SPACE)
+    tracker._log_full_snapshot(1.0, cache.keys, cache.mouse_pos, cache.mouse_buttons)
+
+    pressed = recorder.entries("INPUT_FULL_SNAPSHOT")[-1]["pressed_keys"]
+    assert {"key_code": pygame.K_a, "key_name": "a"} in pressed
+    assert {"key_code": pygame.K_SPACE, "key_name": "space"} in pressed
+    assert len(pressed) == 2
@@ -0,0 +1,73 @@
+"""Round-trip tests for the session journal (snapshots with embedded duplets)."""
+
+import importlib
+import os
+
+import pytest
+
+import logger as logger_module
+from logger import read_session_journal
+
+
+@pytest.fixture
+def journaled_session(session_logger):
+    """A finalized session with two snapshots, each paired with a log chunk."""
+    session_logger._flusher_stop.set()  # Snapshots are taken by the test only
+    session_logger._flush_requested.set()
+    session_logger._flusher_thread.join()
+    session_logger.cache_size_limit = 5  # Write a chunk before each snapshot
+
+    for i in range(10):
+        session_logger.debug("player", {"i": i})
+    session_logger.create_snapshot()
+    for i in range(10):
+        session_logger.debug("enemy", {"i": i})
+    session_logger.create_snapshot()
+    session_logger.finalize_cache()
+    return session_logger
+
+
+def _assert_snapshots(snapshots, session_logger):
+    assert [list(s["snapshot_data"]) for s in snapshots] == [["player"], ["enemy"]]
+    for snapshot, category in zip(snapshots, ("player", "enemy")):
+        assert "kind" not in snapshot
+        assert snapshot["session_id"] == session_logger.session_id
+        records = snapshot["snapshot_data"][category]
+        assert [record["data"]["i"] for record in records] == list(range(10))
+
+
+def test_journal_round_trip(journaled_session):
+    session_dir = journaled_session.session_directory
+
+    kinds = [record["kind"] for record in read_session_journal(session_dir)]
+    assert kinds.count("snapshot") == 2
+    assert "chunk" in kinds
+
+    snapshots = read_session_journal(session_dir, "snapshot")
+    _assert_snapshots(snapshots, journaled_session)
+    assert journaled_session.get_session_snapshots(journaled_session.session_id) == snapshots
+
+    duplets = journaled_session.get_session_duplets(journaled_session.session_id)
+    assert len(duplets) == 2
+    for duplet, snapshot in zip(duplets, snapshots):
+        # Shared fields are filled in from the snapshot the duplet is embedded in
+        for key in ("session_id", "timestamp", "snapshot_time"):
+            assert duplet[key] == snapshot[key]
+        assert duplet["categories"] == list(snapshot["snapshot_data"])
+        assert os.path.exists(duplet["log_chunk"])
+    assert journaled_session._count_duplets() == 2
+
+
+def test_analyze_logs_loads_journal_snapshots(journaled_session, monkeypatch):
+    # analyze_logs pulls in the plotting stack through visualization
+    pytest.importorskip("matplotlib")
+    pytest.importorskip("scipy")
+    # Keep the import from creating a global logger under ./logs. Set through the
+    # module dict: getattr() for the old value would create it
+    monkeypatch.setitem(vars(logger_module), "game_logger", journaled_session)
+    analyze_logs = importlib.import_module("analyze_logs")
+
+    pairs = analyze_logs.load_session_snapshots(journaled_session.session_directory)
+    snapshots = [snapshot for _, snapshot in pairs]
+    _assert_snapshots(snapshots, journaled_session)
+    assert [snapshot_time for snapshot_time, _ in pairs] == [s["snapshot_time"] for s in snapshots]
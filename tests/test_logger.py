@@ -0,0 +1,245 @@
+"""Tests for GameLogger buffering, chunking and session reading."""
+
+import atexit
+import json
+import os
+import queue
+import threading
+
+import logger as logger_module
+
+
+def _fill_cache(session_logger, count, start=0.0):
+    """Put entries straight into the log cache, as the writer thread would."""
+    for i in range(count):
+        session_logger._cache_timestamps.append(start + i)
+        session_logger._cache_categories.append("player")
+        session_logger._cache_datas.append({"hp": i, "state": "idle"})
+        session_logger._cache_priorities.append("normal")
+
+
+def test_failed_dictionary_training_is_not_retried(session_logger, monkeypatch):
+    calls = []
+
+    def failing_train_dictionary(*args, **kwargs):
+        calls.append(args)
+        raise logger_module.zstd.ZstdError("not enough samples")
+
+    monkeypatch.setattr(logger_module.zstd, "train_dictionary", failing_train_dictionary)
+    session_logger.zstd_dict_min_samples = 10
+    session_logger.compression_min_bytes = 0
+
+    for chunk in range(3):
+        _fill_cache(session_logger, 20, start=chunk * 20)
+        session_logger.compress_cache_chunk()
+
+    assert len(calls) == 1
+    # Later chunks fall back to plain zstd and stay readable
+    entries = session_logger.load_session_logs(session_logger.session_id)
+    assert [entry["data"]["hp"] for entry in entries] == list(range(20)) * 3
+
+
+def _stop_flusher(session_logger):
+    """Stop the timer thread so only inline flushes drain the rings."""
+    session_logger._flusher_stop.set()
+    session_logger._flush_requested.set()
+    session_logger._flusher_thread.join()
+
+
+def test_ring_drains_in_order_across_wraparound():
+    buf = logger_module._ThreadLogBuffer(8)
+
+    def append(values):
+        for value in values:
+            slot = buf.tail & buf.mask
+            buf.timestamps[slot] = value
+            buf.categories[slot] = "cat"
+            buf.datas[slot] = {"i": value}
+            buf.priorities[slot] = "normal"
+            buf.tail += 1
+
+    append(range(6))
+    columns, tail = buf.peek()
+    assert columns[0] == list(range(6))
+    buf.head = tail
+    # Slots 6, 7, 0, 1, 2 and 3
+    append(range(6, 12))
+    (timestamps, categories, datas, priorities), buf.head = buf.peek()
+    assert timestamps == list(range(6, 12))
+    assert datas == [{"i": i} for i in range(6, 12)]
+    assert buf.peek() is None
+
+
+def test_full_ring_drops_and_counts_entries(session_logger):
+    _stop_flusher(session_logger)
+    session_logger.log_buffer_capacity = 16
+    session_logger.buffer_flush_entries = 1000  # Never drain inline
+
+    for i in range(20):
+        session_logger.debug("player", {"i": i})
+    session_logger.finalize_cache()
+
+    entries = session_logger.load_session_logs(session_logger.session_id)
+    assert [entry["data"]["i"] for entry in entries] == list(range(16))
+    assert session_logger.dropped_count == 4
+
+
+def test_ring_past_half_full_drains_inline(session_logger):
+    _stop_flusher(session_logger)
+    session_logger.log_buffer_capacity = 16
+    session_logger.buffer_flush_entries = 4
+
+    for i in range(200):
+        session_logger.debug("player", {"i": i})
+    session_logger.finalize_cache()
+
+    entries = session_logger.load_session_logs(session_logger.session_id)
+    assert [entry["data"]["i"] for entry in entries] == list(range(200))
+    assert session_logger.dropped_count == 0
+
+
+def test_finalize_cache_flushes_buffered_entries(session_logger):
+    session_logger.buffer_flush_interval_ns = 60_000_000_000  # Timer never fires
+    for i in range(100):
+        session_logger.debug("player", {"i": i})
+    session_logger.finalize_cache()
+
+    entries = session_logger.load_session_logs(session_logger.session_id)
+    assert [entry["data"]["i"] for entry in entries] == list(range(100))
+    assert not session_logger._cache_timestamps
+
+
+def test_entries_from_two_threads_come_back_in_time_order(session_logger):
+    count = 3000
+    start = threading.Barrier(2)
+
+    def produce(name):
+        start.wait()
+        for i in range(count):
+            session_logger.debug(name, {"thread": name, "i": i})
+
+    threads = [threading.Thread(target=produce, args=(name,)) for name in ("first", "second")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    session_logger.finalize_cache()
+
+    entries = list(session_logger.iter_session_logs(session_logger.session_id))
+    assert len(entries) == 2 * count
+    timestamps = [entry["timestamp"] for entry in entries]
+    assert timestamps == sorted(timestamps)
+    for name in ("first", "second"):
+        assert [entry["data"]["i"] for entry in entries if entry["data"]["thread"] == name] == list(range(count))
+
+
+def test_sessions_index_notices_rewritten_metadata(session_logger):
+    session_logger.finalize_cache()
+    sessions = session_logger.get_cached_sessions()
+    assert [s["session_id"] for s in sessions] == [session_logger.session_id]
+
+    metadata_file = os.path.join(session_logger.session_directory, "metadata.json")
+    with open(metadata_file) as f:
+        metadata = json.load(f)
+    metadata["snapshot_count"] = 42
+    with open(metadata_file, "w") as f:
+        json.dump(metadata, f)
+    # Rewritten in place, so only the file's own mtime moves
+    index_mtime = os.stat(session_logger.sessions_index_path).st_mtime_ns
+    os.utime(metadata_file, ns=(index_mtime + 1_000_000_000, index_mtime + 1_000_000_000))
+
+    assert session_logger.get_cached_sessions()[0]["snapshot_count"] == 42
+
+
+def test_nonblocking_flush_keeps_entries_when_queue_is_full(session_logger, monkeypatch):
+    _stop_flusher(session_logger)
+
+    class FullQueue(queue.Queue):
+        def full(self):
+            return False  # As if the writer's queue filled up after the check
+
+    full_queue = FullQueue(maxsize=1)
+    full_queue.put(None)
+    writer_queue = session_logger._io_queue
+    monkeypatch.setattr(session_logger, "_io_queue", full_queue)
+
+    for i in range(10):
+        session_logger.debug("player", {"i": i})
+    buf = session_logger._tls.buf
+    session_logger._flush_log_buffer(block=False)
+    assert buf.tail - buf.head == 10
+
+    monkeypatch.setattr(session_logger, "_io_queue", writer_queue)
+    session_logger.finalize_cache()
+    entries = session_logger.load_session_logs(session_logger.session_id)
+    assert [entry["data"]["i"] for entry in entries] == list(range(10))
+
+
+def test_flush_log_lines_skipped_without_a_debug_sink(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPTIMIZE_LOGGING", "true")
+    session_logger = logger_module.GameLogger(log_directory=str(tmp_path))
+    try:
+        assert not session_logger._flush_log_enabled
+
+        formatted = []
+        monkeypatch.setattr(session_logger, "_format_bulk_log",
+                            lambda *args: formatted.append(args) or "")
+        for i in range(10):
+            session_logger.debug("player", {"i": i})
+    finally:
+        session_logger.finalize_cache()
+        atexit.unregister(session_logger.finalize_cache)
+
+    assert formatted == []
+    entries = session_logger.load_session_logs(session_logger.session_id)
+    assert [entry["data"]["i"] for entry in entries] == list(range(10))
+
+
+def test_flush_log_lines_built_for_the_debug_file_sink(session_logger):
+    assert session_logger._flush_log_enabled
+
+
+def test_back_to_back_chunks_get_distinct_files(session_logger, monkeypatch):
+    monkeypatch.setattr(logger_module.time, "time", lambda: 1_700_000_000.0)
+    session_logger.compression_min_bytes = 0
+    for chunk in range(3):
+        _fill_cache(session_logger, 5, start=chunk * 5)
+        session_logger.compress_cache_chunk()
+
+    chunk_files = [record["chunk_file"] for record in
+                   logger_module.read_session_journal(session_logger.session_directory, "chunk")]
+    assert len(set(chunk_files)) == 3
+    assert all(os.path.exists(path) for path in chunk_files)
+    entries = session_logger.load_session_logs(session_logger.session_id)
+    assert [entry["data"]["hp"] for entry in entries] == list(range(5)) * 3
+
+
+def test_inline_flush_does_not_wait_for_log_lock(session_logger):
+    _stop_flusher(session_logger)
+    session_logger._flush_requested.clear()
+    session_logger.log_buffer_capacity = 16
+    session_logger.buffer_flush_entries = 4
+
+    registered = threading.Event()
+    lock_held = threading.Event()
+
+    def produce():
+        session_logger.debug("player", {"i": 0})  # Registers this thread's ring
+        registered.set()
+        lock_held.wait()
+        for i in range(1, 20):
+            session_logger.debug("player", {"i": i})
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    registered.wait()
+    with session_logger.log_lock:  # As if the flusher or a snapshot were mid-flush
+        lock_held.set()
+        producer.join(timeout=5)
+        assert not producer.is_alive()
+    assert session_logger._flush_requested.is_set()
+
+    session_logger.finalize_cache()
+    entries = session_logger.load_session_logs(session_logger.session_id)
+    assert [entry["data"]["i"] for entry in entries] == list(range(16))
+    assert session_logger.dropped_count == 4
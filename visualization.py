@@ -2,7 +2,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import json
 import os
-from matplotlib.patches import Polygon
 from scipy.interpolate import make_interp_spline
 from logger import GameLogger
 
@@ -46,15 +45,11 @@ class GameStateVisualizer:
         snapshot_x = np.array([0, 1.5, 3, 4, 5.5, 7, 8.2, 10])
         snapshot_y = 2 + np.sin(snapshot_x) + 0.5*np.sin(2*snapshot_x) + 0.2*np.sin(5*snapshot_x) + snapshot_x*0.1
         
-        # Draw the trapezoids
+        # Draw the trapezoids between consecutive snapshots as one filled area
+        ax.fill_between(snapshot_x, snapshot_y, 0,
+                        facecolor=self.colors['trapezoids'], alpha=0.3, linewidth=0)
+        
         for i in range(len(snapshot_x)-1):
-            # Create trapezoid
-            x_points = [snapshot_x[i], snapshot_x[i], snapshot_x[i+1], snapshot_x[i+1]]
-            y_points = [0, snapshot_y[i], snapshot_y[i+1], 0]
-            trapezoid = Polygon(np.column_stack([x_points, y_points]), 
-                               facecolor=self.colors['trapezoids'], alpha=0.3)
-            ax.add_patch(trapezoid)
-            
             # Add time interval arrows (x-axis)
             interval = snapshot_x[i+1] - snapshot_x[i]
             mid_x = (snapshot_x[i] + snapshot_x[i+1]) / 2
@@ -132,93 +127,98 @@ class GameStateVisualizer:
         
         return fig
     
-    def visualize_session_data(self, session_id=None, metric_name="player_health", save_path=None):
+    def _load_metric_series(self, session_id, metric_name):
         """
-        Create a visualization of actual game data using the calculus analogy.
+        Load the values of a metric over a session as time-sorted NumPy arrays.
         
         Args:
             session_id: The session ID to analyze (loads most recent if None)
-            metric_name: The metric to analyze (e.g., "player_health", "enemy_count")
-            save_path: Where to save the figure (displays if None)
+            metric_name: The metric to extract (e.g., "player_health", "enemy_count")
+            
+        Returns:
+            tuple: (times, values) float arrays, with times in seconds from the first
+                sample, or None if there is no data for the metric
         """
         # Get session data
         if session_id is None:
             # Get most recent session
-            sessions = self.logger.get_cached_sessions()
-            if not sessions:
+            session_id = self.logger.get_latest_session_id()
+            if session_id is None:
                 return None
-            session_id = sessions[-1]['session_id']
             
-        # Load session logs
-        logs = self.logger.load_session_logs(session_id)
-        if not logs:
-            return None
+        # Extract (timestamp, value) samples of the specified metric, streaming the
+        # session's logs so only the samples are kept in memory
+        samples = []
         
-        # Extract timestamps and the specified metric
-        timestamps = []
-        values = []
-        
-        for log in logs:
+        for log in self.logger.iter_session_logs(session_id):
             # Check if this is a snapshot log with game state data
             if 'snapshot' in log and 'timestamp' in log:
                 # For simplicity, we'll handle a few common metrics
                 if metric_name == "player_health" and 'player' in log['snapshot']:
                     if 'health' in log['snapshot']['player']:
-                        timestamps.append(log['timestamp'])
-                        values.append(log['snapshot']['player']['health'])
+                        samples.append((log['timestamp'], log['snapshot']['player']['health']))
                         
                 elif metric_name == "enemy_count" and 'enemies' in log['snapshot']:
-                    timestamps.append(log['timestamp'])
-                    values.append(len(log['snapshot']['enemies']))
+                    samples.append((log['timestamp'], len(log['snapshot']['enemies'])))
                     
                 elif metric_name == "player_x" and 'player' in log['snapshot']:
                     if 'x' in log['snapshot']['player']:
-                        timestamps.append(log['timestamp'])
-                        values.append(log['snapshot']['player']['x'])
+                        samples.append((log['timestamp'], log['snapshot']['player']['x']))
                         
                 # Add more metrics as needed
         
-        if not timestamps or not values:
+        if not samples:
             print(f"No data found for metric: {metric_name}")
             return None
-            
-        # Convert to relative timestamps (starting from 0)
-        start_time = min(timestamps)
-        rel_timestamps = [t - start_time for t in timestamps]
+        
+        # Sort by time and make timestamps relative (starting from 0) in bulk
+        times, values = np.array(samples, dtype='f8').T
+        order = np.argsort(times, kind='stable')
+        times = times[order]
+        values = values[order]
+        times -= times[0]
+        return times, values
+    
+    def visualize_session_data(self, session_id=None, metric_name="player_health", save_path=None):
+        """
+        Create a visualization of actual game data using the calculus analogy.
+        
+        Args:
+            session_id: The session ID to analyze (loads most recent if None)
+            metric_name: The metric to analyze (e.g., "player_health", "enemy_count")
+            save_path: Where to save the figure (displays if None)
+        """
+        # Load the metric as time-sorted arrays
+        series = self._load_metric_series(session_id, metric_name)
+        if series is None:
+            return None
+        sorted_times, sorted_values = series
         
         # Create figure
         fig, ax = plt.subplots(figsize=self.fig_size, dpi=self.dpi)
         
         # Plot the discrete points
-        ax.scatter(rel_timestamps, values, color=self.colors['snapshots'], s=80, zorder=5, label="Snapshots")
+        ax.scatter(sorted_times, sorted_values, color=self.colors['snapshots'], s=80, zorder=5, label="Snapshots")
         
         # Create a smooth curve approximation using spline interpolation (if we have enough points)
-        if len(rel_timestamps) > 3:
-            # Sort data by timestamps to ensure proper interpolation
-            sorted_indices = np.argsort(rel_timestamps)
-            sorted_times = np.array(rel_timestamps)[sorted_indices]
-            sorted_values = np.array(values)[sorted_indices]
-            
+        if len(sorted_times) > 3:
             # Create spline model for smoother curve
-            x_smooth = np.linspace(min(sorted_times), max(sorted_times), 500)
+            x_smooth = np.linspace(sorted_times[0], sorted_times[-1], 500)
             try:
                 spline = make_interp_spline(sorted_times, sorted_values, k=min(3, len(sorted_times)-1))
                 y_smooth = spline(x_smooth)
                 ax.plot(x_smooth, y_smooth, color=self.colors['curve'], linewidth=2.5, label="Estimated True State")
                 
-                # Draw trapezoids
-                for i in range(len(sorted_times)-1):
-                    x_points = [sorted_times[i], sorted_times[i], sorted_times[i+1], sorted_times[i+1]]
-                    y_points = [0, sorted_values[i], sorted_values[i+1], 0]
-                    trapezoid = Polygon(np.column_stack([x_points, y_points]), 
-                                      facecolor=self.colors['trapezoids'], alpha=0.3)
-                    ax.add_patch(trapezoid)
+                # Draw the trapezoids between consecutive snapshots as one filled area
+                # rather than one patch each
+                ax.fill_between(sorted_times, sorted_values, 0,
+                                facecolor=self.colors['trapezoids'], alpha=0.3, linewidth=0)
             except:
                 # Fall back to simple line if spline fails
                 ax.plot(sorted_times, sorted_values, color=self.colors['curve'], linewidth=2.5, label="Estimated True State")
         else:
             # Just connect the dots with straight lines if too few points
-            ax.plot(rel_timestamps, values, color=self.colors['curve'], linewidth=2.5, label="Estimated True State")
+            ax.plot(sorted_times, sorted_values, color=self.colors['curve'], linewidth=2.5, label="Estimated True State")
         
         # Add labels and title
         ax.set_xlabel('Time (seconds)', fontsize=12)
@@ -230,7 +230,7 @@ class GameStateVisualizer:
         ax.legend(loc='best')
         
         # Set y-axis to start at 0 if all values are positive
-        if min(values) >= 0:
+        if sorted_values.min() >= 0:
             ax.set_ylim(bottom=0)
         
         # Save or show
@@ -253,57 +253,22 @@ class GameStateVisualizer:
             window_size: Size of the window for calculating finite differences
             save_path: Where to save the figure (displays if None)
         """
-        # Get session data
-        if session_id is None:
-            # Get most recent session
-            sessions = self.logger.get_cached_sessions()
-            if not sessions:
-                return None
-            session_id = sessions[-1]['session_id']
-            
-        # Load session logs
-        logs = self.logger.load_session_logs(session_id)
-        if not logs:
+        # Load the metric as time-sorted arrays
+        series = self._load_metric_series(session_id, metric_name)
+        if series is None:
             return None
-        
-        # Extract timestamps and the specified metric
-        timestamps = []
-        values = []
-        
-        for log in logs:
-            # Similar extraction as visualize_session_data
-            if 'snapshot' in log and 'timestamp' in log:
-                if metric_name == "player_health" and 'player' in log['snapshot']:
-                    if 'health' in log['snapshot']['player']:
-                        timestamps.append(log['timestamp'])
-                        values.append(log['snapshot']['player']['health'])
-                # Add more metrics as needed
-        
-        if not timestamps or not values:
-            print(f"No data found for metric: {metric_name}")
-            return None
-            
-        # Convert to relative timestamps (starting from 0)
-        start_time = min(timestamps)
-        rel_timestamps = [t - start_time for t in timestamps]
-        
-        # Sort data by timestamps
-        sorted_indices = np.argsort(rel_timestamps)
-        sorted_times = np.array(rel_timestamps)[sorted_indices]
-        sorted_values = np.array(values)[sorted_indices]
-        
-        # Calculate finite differences (derivatives)
-        derivatives = []
-        derivative_times = []
-        
-        for i in range(window_size, len(sorted_times)):
-            # Calculate derivative using finite difference over the window
-            dx = sorted_times[i] - sorted_times[i-window_size]
-            dy = sorted_values[i] - sorted_values[i-window_size]
-            if dx != 0:  # Avoid division by zero
-                derivative = dy / dx
-                derivatives.append(derivative)
-                derivative_times.append(sorted_times[i-window_size//2])  # Use middle of window
+        sorted_times, sorted_values = series
+        
+        # Calculate finite differences (derivatives) over the window for every point
+        # at once
+        count = max(len(sorted_times) - window_size, 0)
+        dx = sorted_times[window_size:] - sorted_times[:count]
+        dy = sorted_values[window_size:] - sorted_values[:count]
+        start = window_size - window_size // 2  # Use middle of window
+        window_times = sorted_times[start:start + count]
+        valid = dx != 0  # Avoid division by zero
+        derivatives = dy[valid] / dx[valid]
+        derivative_times = window_times[valid]
         
         # Create figure
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=self.fig_size, dpi=self.dpi, sharex=True)